@@ -0,0 +1,186 @@
+import os
+import json
+
+import numpy as np
+
+###################################################################
+# PROBLEM BANKS
+# Each problem type's bank is one table, stored as banks/<TYPE>.bank.
+# A bank file is a JSON header followed by one binary block per column
+# (or a few, for strings and variable-length arrays), so a column can
+# be memory-mapped without reading the rest of the file. Sampling n
+# rows only touches those n rows, plus any columns used to filter.
+#
+# Column kinds:
+#   array:    numbers, one block of shape (nrows, *shape), e.g. payoffs
+#   category: strings, integer codes of shape (nrows, *shape) into a
+#             list of categories kept in the header, e.g. gametype
+#   ragged:   numbers that may be scalars or arrays of varying length
+#             in different rows, e.g. the x of a PresentValueProblem
+###################################################################
+
+BANK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'banks')
+MAGIC = b'ECONBANK'
+ALIGN = 64
+
+def bank_path(TYPE, root=BANK_DIR):
+    return os.path.join(root, f"{TYPE}.bank")
+
+def encode_column(name, values):
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'biuf':
+        return {'kind': 'array'}, {'data': values}
+    cells = [np.asarray(v) for v in values]
+    kinds = {c.dtype.kind for c in cells}
+    shapes = {c.shape for c in cells}
+    if kinds <= {'U'} and len(shapes)==1:
+        categories = sorted({s for c in cells for s in c.ravel().tolist()})
+        lookup = {s: i for i, s in enumerate(categories)}
+        codes = np.array([[lookup[s] for s in c.ravel().tolist()] for c in cells], dtype=np.int32)
+        codes = codes.reshape((len(cells),) + shapes.pop())
+        return {'kind': 'category', 'categories': categories}, {'codes': codes}
+    if kinds <= set('biuf') and len(shapes)==1:
+        return {'kind': 'array'}, {'data': np.stack(cells) if cells else np.array(cells)}
+    if kinds <= set('biuf') and all(c.ndim<=1 for c in cells):
+        sizes = [c.size for c in cells]
+        return {'kind': 'ragged'}, {
+            'values': np.concatenate([c.ravel() for c in cells]),
+            'offsets': np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64),
+            'ndim': np.array([c.ndim for c in cells], dtype=np.uint8),
+        }
+    raise ValueError(f"cannot store column {name} with kinds {sorted(kinds)} and shapes {sorted(shapes)}")
+
+def get_columns(data):
+    # data is a DataFrame or a list of dicts with the same keys
+    if hasattr(data, 'columns'):
+        return {c: (data[c].to_numpy() if data[c].dtype.kind in 'biuf' else data[c].tolist()) for c in data.columns}
+    keys = list(data[0].keys()) if len(data)>0 else []
+    columns = {}
+    for k in keys:
+        values = [row[k] for row in data]
+        if all(np.ndim(v)==0 and np.asarray(v).dtype.kind in 'biuf' for v in values):
+            values = np.array(values)
+        columns[k] = values
+    return columns
+
+def write_bank(TYPE, data, root=BANK_DIR):
+    columns = get_columns(data)
+    nrows = len(data)
+    header = {'nrows': nrows, 'columns': []}
+    blocks = []
+    offset = 0
+    for name, values in columns.items():
+        meta, arrays = encode_column(name, values)
+        meta['name'] = name
+        for key, arr in arrays.items():
+            arr = np.ascontiguousarray(arr, dtype=arr.dtype.newbyteorder('<'))
+            meta[key] = {'dtype': arr.dtype.str, 'shape': list(arr.shape), 'offset': offset}
+            blocks.append((offset, arr))
+            offset += -(-arr.nbytes//ALIGN)*ALIGN
+        header['columns'].append(meta)
+    head = json.dumps(header).encode()
+    start = -(-(len(MAGIC) + 8 + len(head))//ALIGN)*ALIGN
+    os.makedirs(root, exist_ok=True)
+    path = bank_path(TYPE, root)
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(MAGIC)
+        f.write(np.uint64(start).tobytes())
+        f.write(head)
+        for pos, arr in blocks:
+            f.seek(start + pos)
+            f.write(arr.tobytes())
+        f.truncate(start + offset)
+    os.replace(tmp, path)
+    return path
+
+class Bank:
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            if f.read(len(MAGIC))!=MAGIC:
+                raise ValueError(f"{path} is not a problem bank")
+            start = int(np.frombuffer(f.read(8), dtype=np.uint64)[0])
+            header = json.loads(f.read(start - len(MAGIC) - 8).rstrip(b'\0'))
+        self.path = path
+        self.start = start
+        self.nrows = header['nrows']
+        self.meta = {c['name']: c for c in header['columns']}
+        self.columns = list(self.meta.keys())
+        self.blocks = {}
+    def __len__(self):
+        return self.nrows
+    def block(self, name, key):
+        if (name, key) not in self.blocks:
+            spec = self.meta[name][key]
+            shape = tuple(spec['shape'])
+            if np.prod(shape)==0:
+                arr = np.empty(shape, dtype=spec['dtype'])
+            else:
+                arr = np.memmap(self.path, dtype=spec['dtype'], mode='r', offset=self.start + spec['offset'], shape=shape)
+            self.blocks[(name, key)] = arr
+        return self.blocks[(name, key)]
+    def __getitem__(self, name):
+        # the whole column, e.g. for building a where= mask
+        return self.column(name, slice(None))
+    def column(self, name, idx):
+        meta = self.meta[name]
+        if meta['kind']=='array':
+            return self.block(name, 'data')[idx]
+        if meta['kind']=='category':
+            return np.asarray(meta['categories'])[self.block(name, 'codes')[idx]]
+        offsets = self.block(name, 'offsets')
+        ndim = self.block(name, 'ndim')
+        values = self.block(name, 'values')
+        # only the requested rows' offsets are read
+        if isinstance(idx, slice):
+            rows = range(self.nrows)[idx]
+        else:
+            rows = np.asarray(idx)
+            if rows.dtype==bool:
+                rows = np.flatnonzero(rows)
+        cells = np.empty(len(rows), dtype=object)
+        for k, i in enumerate(rows):
+            cell = np.array(values[offsets[i]:offsets[i+1]])
+            cells[k] = cell if ndim[i] else cell[0]
+        return cells
+    def rows(self, idx):
+        # params dicts for the rows in idx, with nested values as lists
+        idx = np.asarray(idx, dtype=np.int64)
+        cols = {name: self.column(name, idx) for name in self.columns}
+        out = []
+        for k in range(len(idx)):
+            row = {}
+            for name, col in cols.items():
+                v = col[k]
+                row[name] = v.tolist() if isinstance(v, np.ndarray) and self.meta[name]['kind']!='ragged' else v
+                if isinstance(row[name], np.str_):
+                    row[name] = str(row[name])
+            out.append(row)
+        return out
+    def mask(self, where):
+        # where is a boolean mask or a dict of column: value to match
+        if isinstance(where, dict):
+            mask = np.ones(self.nrows, dtype=bool)
+            for name, value in where.items():
+                mask &= (self[name]==value)
+            return mask
+        return np.asarray(where, dtype=bool)
+    def sample(self, n=1, where=None, rng=None, replace=False):
+        rng = np.random.default_rng(rng)
+        if where is None:
+            idx = rng.choice(self.nrows, size=n, replace=replace)
+        else:
+            candidates = np.flatnonzero(self.mask(where))
+            idx = candidates[rng.choice(len(candidates), size=n, replace=replace)]
+        return self.rows(idx)
+    def to_frame(self):
+        import pandas as pd
+        data = {}
+        for name in self.columns:
+            col = self[name]
+            if self.meta[name]['kind']!='ragged' and col.ndim>1:
+                col = col.tolist()
+            data[name] = col
+        return pd.DataFrame(data, columns=self.columns)
+
+def open_bank(TYPE, root=BANK_DIR):
+    return Bank(bank_path(TYPE, root))
@@ -0,0 +1,403 @@
+import numpy as np
+from itertools import combinations
+
+###################################################################
+# BATCH SOLVERS
+# Vectorized counterparts of the closed-form models in utils2.
+# Every argument may be a scalar or an array; arguments are broadcast
+# against each other and each solution entry is an array of that shape.
+# The formulas follow the scalar classes term by term, so each entry
+# agrees with the scalar solution to within equals(). BatchNormalForm
+# takes whole payoff tables, stacked along the leading axes.
+###################################################################
+
+def broadcast(*args):
+    return np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in args])
+
+class BatchLinearMarket:
+    # p = ad - bd*q
+    # p = as + bs*q
+    # q = (ad-as)/(bd+bs)
+    def __init__(self, ad, bd, as_, bs):
+        ad, bd, as_, bs = broadcast(ad, bd, as_, bs)
+        q = (ad - as_)/(bd + bs)
+        p = ad - bd*q
+        CS = 0.5*(ad - p)*q
+        PS = 0.5*(p - as_)*q
+        self.ad, self.bd, self.as_, self.bs = ad, bd, as_, bs
+        self.eq = {'q':q, 'p':p, 'CS': CS, 'PS': PS, 'TS':CS+PS}
+
+class BatchMonopoly:
+    # p = alpha - beta*q
+    # c(q) = f + aq + b*q^2
+    def __init__(self, alpha, beta, f=0, a=0, b=0.5):
+        alpha, beta, f, a, b = broadcast(alpha, beta, f, a, b)
+        q = (alpha - a)/(2*(beta + b))
+        p = alpha - beta*q
+        profit = p*q - f - a*q - b*q**2
+        CS = 0.5*(alpha - p)*q
+        q_eff = (alpha - a)/(beta + 2*b)
+        p_eff = alpha - beta*q_eff
+        profit_eff = p_eff*q_eff - f - a*q_eff - b*q_eff**2
+        CS_eff = 0.5*(alpha - p_eff)*q_eff
+        DWL = (CS_eff + profit_eff) - (CS + profit)
+        self.alpha, self.beta, self.f, self.a, self.b = alpha, beta, f, a, b
+        self.sol = {'q':q, 'p':p, 'CS':CS, 'profit':profit,
+                    'q_eff': q_eff, 'p_eff': p_eff, 'CS_eff':CS_eff, 'profit_eff':profit_eff,
+                    'DWL':DWL}
+
+class BatchCournotN:
+    # p = alpha - beta*Q, N identical firms with constant marginal cost mc
+    def __init__(self, alpha, beta, mc, N):
+        alpha, beta, mc, N = broadcast(alpha, beta, mc, N)
+        q = (alpha - mc)/((N+1)*beta)
+        Q = N*q
+        p = alpha - beta*Q
+        profit = p*q - mc*q
+        total_profit = N*profit
+        self.alpha, self.beta, self.mc, self.N = alpha, beta, mc, N
+        self.sol = {'q':q, 'Q':Q, 'p':p, 'profit':profit, 'total_profit':total_profit}
+
+class BatchCournot:
+    # p = alpha - beta*Q, firm i with c_i(q) = a_i*q + 0.5*b_i*q^2, the
+    # QuadraticCostFirm costs Cournot2 uses. a and b have the firms on
+    # their last axis, (..., N), and alpha and beta broadcast against the
+    # rest. Each firm's first order condition is
+    #   (beta + b_i)*q_i + beta*Q = alpha - a_i
+    # so with d_i = beta + b_i, summing q_i = (alpha - a_i - beta*Q)/d_i
+    # over firms gives Q in closed form, and no system needs solving.
+    # Assumes every firm produces (q_i>0), as Cournot2 does.
+    def __init__(self, alpha, beta, a, b):
+        a, b = broadcast(a, b)
+        alpha, beta = broadcast(alpha, beta)
+        alpha, beta = alpha[...,None], beta[...,None]
+        d = beta + b
+        Q = np.sum((alpha - a)/d, axis=-1, keepdims=True)/(1 + beta*np.sum(1/d, axis=-1, keepdims=True))
+        q = (alpha - a - beta*Q)/d
+        p = alpha - beta*Q
+        profit = p*q - a*q - 0.5*b*q**2
+        self.alpha, self.beta, self.a, self.b = alpha[...,0], beta[...,0], a, b
+        self.N = a.shape[-1]
+        self.sol = {'q':q, 'Q':Q[...,0], 'p':p[...,0], 'profit':profit, 'total_profit':profit.sum(axis=-1)}
+
+    def sol2(self):
+        # in Cournot2's keys, for two firm markets
+        assert self.N==2
+        sol = self.sol
+        return {'p':sol['p'], 'q1':sol['q'][...,0], 'q2':sol['q'][...,1], 'Q':sol['Q'],
+                'profit1':sol['profit'][...,0], 'profit2':sol['profit'][...,1]}
+
+class BatchPriceDiscrimination:
+    # K segments with p_k = alpha_k - beta_k*q_k, c(q) = c*q. alpha and
+    # beta have the segments on their last axis, (..., K), and c
+    # broadcasts against the rest. Segments whose demand starts below c
+    # aren't served when the monopolist discriminates (q_k = 0, p_k = alpha_k).
+    # With a uniform price, aggregate demand is kinked: below the k-th
+    # highest intercept the top k segments buy, and on that piece inverse
+    # demand is p = gamma - delta*Q, with delta = 1/sum(1/beta) and
+    # gamma = delta*sum(alpha/beta) over those segments, as in
+    # PriceDiscrimination's demand_both. Profit is concave on each piece,
+    # so the uniform price is the best of the per-piece optima, each
+    # clipped to its piece.
+    # all_served=True instead serves every segment under both regimes, as
+    # PriceDiscrimination does: q_k = (alpha_k - c)/(2*beta_k) even when it
+    # is negative, and one uniform price on the demand of all K segments,
+    # even where dropping a segment would earn more.
+    def __init__(self, alpha, beta, c=1, all_served=False):
+        alpha, beta = broadcast(alpha, beta)
+        c = np.asarray(c, dtype=float)[...,None]
+
+        # discriminating
+        served = (alpha > c) | all_served
+        q = np.where(served, (alpha - c)/(2*beta), 0)
+        p = np.where(served, (alpha + c)/2, alpha)
+        profit = (p - c)*q
+
+        if all_served:
+            delta = 1/np.sum(1/beta, axis=-1)
+            gamma = delta*np.sum(alpha/beta, axis=-1)
+            Q_nopd = (gamma - c[...,0])/(2*delta)
+            p_nopd = gamma - delta*Q_nopd
+            q_nopd = alpha/beta - p_nopd[...,None]/beta
+        else:
+            # uniform, piece k (top k+1 segments buying) lies between the
+            # (k+1)-th and (k+2)-th highest intercepts
+            order = np.argsort(-alpha, axis=-1)
+            alpha_s = np.take_along_axis(alpha, order, axis=-1)
+            beta_s = np.take_along_axis(beta, order, axis=-1)
+            delta = 1/np.cumsum(1/beta_s, axis=-1)
+            gamma = delta*np.cumsum(alpha_s/beta_s, axis=-1)
+            lower = np.concatenate([alpha_s[...,1:], np.full(alpha_s.shape[:-1] + (1,), -np.inf)], axis=-1)
+            candidates = np.clip((gamma + c)/2, lower, alpha_s)
+            demand = lambda price: np.maximum(0, (alpha[...,None,:] - price[...,None])/beta[...,None,:])
+            candidate_profit = (candidates - c)*demand(candidates).sum(axis=-1)
+            best = np.argmax(candidate_profit, axis=-1)[...,None]
+            p_nopd = np.take_along_axis(candidates, best, axis=-1)[...,0]
+            q_nopd = demand(p_nopd[...,None])[...,0,:]
+            Q_nopd = q_nopd.sum(axis=-1)
+
+        self.alpha, self.beta, self.c = alpha, beta, c[...,0]
+        self.K = alpha.shape[-1]
+        self.all_served = all_served
+        self.sol = {'q':q, 'p':p, 'profit':profit, 'served':served,
+                    'profit_pd':profit.sum(axis=-1),
+                    'p_nopd':p_nopd, 'q_nopd':q_nopd, 'Q_nopd':Q_nopd,
+                    'profit_nopd':(p_nopd - c[...,0])*Q_nopd,
+                    'served_nopd':(q_nopd > 0) | all_served}
+
+    def sol2(self):
+        # in PriceDiscriminationProblem's keys, for two segments A and B;
+        # its values only match the problem's with all_served=True
+        assert self.K==2 and self.all_served
+        sol = self.sol
+        return {'qA':sol['q'][...,0], 'pA':sol['p'][...,0], 'profitA':sol['profit'][...,0],
+                'qB':sol['q'][...,1], 'pB':sol['p'][...,1], 'profitB':sol['profit'][...,1],
+                'profit_pd':sol['profit_pd'], 'q_nopd':sol['Q_nopd'], 'p_nopd':sol['p_nopd'],
+                'qA_nopd':sol['q_nopd'][...,0], 'qB_nopd':sol['q_nopd'][...,1],
+                'profit_nopd':sol['profit_nopd']}
+
+UTILITY = ['ln', 'sqrt', 'linear', 'crra', 'cara']
+
+def utility(fun, r, x):
+    # u(x) for each family; r is the CRRA or CARA coefficient, and ln and
+    # sqrt are the CRRA members Insurance uses (r=1 and r=0.5, unscaled)
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        crra = np.where(r==1, np.log(x), x**(1-r)/(1-r))
+        cara = np.where(r==0, x, (1 - np.exp(-r*x))/np.where(r==0, 1, r))
+        return np.select([fun=='ln', fun=='sqrt', fun=='linear', fun=='crra'],
+                         [np.log(x), np.sqrt(x), x, crra], cara)
+
+def utility_inv(fun, r, u):
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        crra = np.where(r==1, np.exp(u), ((1-r)*u)**(1/(1-r)))
+        cara = np.where(r==0, u, -np.log(1 - r*u)/np.where(r==0, 1, r))
+        return np.select([fun=='ln', fun=='sqrt', fun=='linear', fun=='crra'],
+                         [np.exp(u), u**2, u, crra], cara)
+
+class BatchLottery:
+    # Lotteries paying x[..., i] with probability p[..., i], outcomes on
+    # the last axis, valued by a utility family in UTILITY (or an array of
+    # them) with coefficient r:
+    #   ln:     u = ln(x)             sqrt: u = sqrt(x)
+    #   linear: u = x
+    #   crra:   u = x^(1-r)/(1-r), ln(x) at r=1
+    #   cara:   u = (1 - exp(-r*x))/r, x at r=0
+    # fun and r broadcast against the lotteries' leading axes.
+    # RP is the risk premium, EX - CE.
+    def __init__(self, x, p, fun='ln', r=1):
+        x, p = broadcast(x, p)
+        shape = np.broadcast_shapes(x.shape[:-1], np.shape(fun), np.shape(r))
+        x = np.broadcast_to(x, shape + x.shape[-1:])
+        p = np.broadcast_to(p, shape + p.shape[-1:])
+        fun = np.broadcast_to(np.asarray(fun), shape)
+        assert np.isin(fun, UTILITY).all()
+        r = np.broadcast_to(np.asarray(r, dtype=float), shape)
+        EX = np.sum(p*x, axis=-1)
+        EU = np.sum(p*utility(fun[...,None], r[...,None], x), axis=-1)
+        CE = utility_inv(fun, r, EU)
+        # CARA's EU rounds to 1/r once r*x is large, so its CE is taken
+        # directly, as min(x) - ln(E[exp(-r*(x - min(x)))])/r
+        cara = (fun=='cara') & (r!=0)
+        if cara.any():
+            m = x.min(axis=-1, keepdims=True)
+            rc = np.where(cara, r, 1)[...,None]
+            with np.errstate(over='ignore'):
+                CE_cara = m[...,0] - np.log(np.sum(p*np.exp(-rc*(x - m)), axis=-1))/rc[...,0]
+            CE = np.where(cara, CE_cara, CE)
+        self.x, self.p, self.fun, self.r = x, p, fun, r
+        self.sol = {'EX':EX, 'EU':EU, 'CE':CE, 'RP':EX - CE,
+                    'Var':np.sum(p*(x - EX[...,None])**2, axis=-1)}
+
+class BatchInsurance:
+    # fun is 'ln' or 'sqrt', or an array of them, or any family in UTILITY
+    # with coefficient r. A two outcome BatchLottery: W0 with probability
+    # 1-p, W0-D with probability p.
+    def __init__(self, W0=1000, D=200, p=0.2, fun='ln', r=1):
+        W0, D, p = broadcast(W0, D, p)
+        lottery = BatchLottery(np.stack([W0, W0 - D], axis=-1), np.stack([1-p, p], axis=-1), fun, r)
+        sol = lottery.sol
+        WTP = W0 - sol['CE']
+        FairCost = p*D
+        self.W0, self.D, self.p, self.fun = W0, D, p, lottery.fun
+        self.lottery = lottery
+        self.sol = {'EX':sol['EX'], 'EU':sol['EU'], 'CE':sol['CE'], 'WTP':WTP, 'FairCost':FairCost}
+
+class BatchSavings:
+    # max ln c1 + beta ln c2 s.t. c1 + p c2 = Y
+    def __init__(self, Y, beta, p):
+        Y, beta, p = broadcast(Y, beta, p)
+        c2 = Y/(p*(1+1/beta))
+        c1 = Y - p*c2
+        r = (1-p)/p
+        self.Y, self.beta, self.p = Y, beta, p
+        self.sol = {'c1':c1, 'c2':c2, 'r':r}
+
+class BatchConsumption:
+    # max sum_t beta^(t-1) u(c_t), t = 1..T, u CRRA with coefficient rho
+    # (ln c at rho=1), with income y[..., t] on the last axis. A bond bought
+    # in period t at price p[..., t] pays $1 in t+1; give p, of shape
+    # (..., T-1) or anything that broadcasts to it, or interest rates r,
+    # with p = 1/(1+r). Each period c_t + p_t*b_t = y_t + b_(t-1), with
+    # b_0 = 0 and b_T = 0, and with a borrowing limit, b_t >= -limit.
+    # Everything is valued in period 1 units, P_t = p_1*...*p_(t-1).
+    # Euler's equation gives c_t proportional to h_t = (beta^(t-1)/P_t)^(1/rho),
+    # so without a limit c_1 = W/sum(P*h), where W is the present value of
+    # income. With a limit, consumption follows Euler's equation between
+    # the periods where the limit binds. A stretch starting at s with
+    # b_(s-1) = -limit (or b_0 = 0) and ending at k with b_k = -limit
+    # (or b_T = 0) affords c_s = R(s,k)/G(s,k), and the stretch that
+    # starts at s is the one with the smallest c_s, so every (s, k) pair is
+    # solved at once and the path is read off from period 1.
+    def __init__(self, y, beta, p=None, r=None, rho=1, limit=None):
+        assert (p is None) != (r is None)
+        y = np.asarray(y, dtype=float)
+        T = y.shape[-1]
+        p = 1/(1 + np.asarray(r, dtype=float)) if p is None else np.asarray(p, dtype=float)
+        beta, rho = broadcast(beta, rho)
+        shape = np.broadcast_shapes(y.shape[:-1], beta.shape, np.shape(p)[:-1] if np.ndim(p) else ())
+        y = np.broadcast_to(y, shape + (T,))
+        p = np.broadcast_to(p, shape + (T-1,))
+        beta, rho = np.broadcast_to(beta, shape)[...,None], np.broadcast_to(rho, shape)[...,None]
+        t = np.arange(T)
+        P = np.concatenate([np.ones(shape + (1,)), np.cumprod(p, axis=-1)], axis=-1)
+        h = (beta**t/P)**(1/rho)
+        W = np.sum(P*y, axis=-1)
+
+        if limit is None:
+            c = (W/np.sum(P*h, axis=-1))[...,None]*h
+        else:
+            L = np.broadcast_to(np.asarray(limit, dtype=float), shape)[...,None]
+            Yc = np.concatenate([np.zeros(shape + (1,)), np.cumsum(P*y, axis=-1)], axis=-1)
+            Hc = np.concatenate([np.zeros(shape + (1,)), np.cumsum(P*h, axis=-1)], axis=-1)
+            # R[..., s, k] and G[..., s, k] for the stretch from s to k (0-based)
+            enter = np.where(t==0, 0, -L)*P
+            leave = np.where(t<T-1, L*np.concatenate([P[...,1:], np.zeros(shape + (1,))], axis=-1), 0)
+            R = enter[...,:,None] + Yc[...,None,1:] - Yc[...,:-1,None] + leave[...,None,:]
+            G = (Hc[...,None,1:] - Hc[...,:-1,None])/h[...,:,None]
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cs = np.where(t[None,:]>=t[:,None], R/G, np.inf)
+            end = np.argmin(cs, axis=-1)
+            c_start = np.min(cs, axis=-1)
+            c = np.zeros(shape + (T,))
+            start = np.zeros(shape, dtype=int)
+            stop = np.take_along_axis(end, start[...,None], axis=-1)[...,0]
+            for i in range(T):
+                new = i > stop
+                start = np.where(new, i, start)
+                stop = np.where(new, end[...,i], stop)
+                c[...,i] = (np.take_along_axis(c_start, start[...,None], axis=-1)[...,0]
+                            *h[...,i]/np.take_along_axis(h, start[...,None], axis=-1)[...,0])
+
+        # bonds held at the end of each period
+        b = np.zeros(shape + (T,))
+        held = np.zeros(shape)
+        for i in range(T-1):
+            held = (y[...,i] + held - c[...,i])/p[...,i]
+            b[...,i] = held
+        with np.errstate(divide='ignore', invalid='ignore'):
+            U = np.sum(beta**t*utility(np.array('crra'), rho, c), axis=-1)
+        self.y, self.beta, self.p, self.rho, self.limit = y, beta[...,0], p, rho[...,0], limit
+        self.T = T
+        self.sol = {'c':c, 'b':b, 'W':W, 'P':P, 'U':U}
+        if limit is not None:
+            self.sol['binding'] = (b <= -L + 1e-9) & (t < T-1)
+
+    def sol2(self):
+        # in Savings' keys, for two periods
+        assert self.T==2
+        p = self.p[...,0]
+        return {'c1':self.sol['c'][...,0], 'c2':self.sol['c'][...,1], 'r':(1-p)/p}
+
+class BatchGeneralEquilibrium:
+    # f(L) = A*L^kf
+    # u(L) = w*L - d*L^kw
+    # u(q) = a*ln(q) - p*q
+    # Equilibrium Labor: L = (a*kf/d*kw)^(1/kw)
+    def __init__(self, A, kf, d, kw, a):
+        A, kf, d, kw, a = broadcast(A, kf, d, kw, a)
+        L = (a*kf/(d*kw))**(1/kw)
+        w = a*kf/L
+        q = A*L**kf
+        p = a/q
+        U_consumer = a*np.log(q) - p*q
+        U_worker = w*L - d*L**kw
+        profit = p*A*L**kf - w*L
+        self.A, self.kf, self.d, self.kw, self.a = A, kf, d, kw, a
+        self.eq = {'L':L, 'w':w, 'p':p, 'q':q, 'U_consumer':U_consumer, 'U_worker':U_worker, 'profit':profit}
+
+class BatchNormalForm:
+    # Two-player games stacked in one payoff array of shape (..., N, M, 2):
+    # payoffs[..., i, j, k] is player k's payoff when player 1 plays
+    # strategy i and player 2 plays strategy j, the same layout as
+    # NormalForm's nested payoffs list. Each solution entry has the
+    # batch shape (...) in front.
+    #   br1[..., i, j]: i is a best response of player 1 to j
+    #   br2[..., i, j]: j is a best response of player 2 to i
+    #   ne[..., i, j]:  (i, j) is a pure strategy Nash equilibrium
+    def __init__(self, payoffs, tol=1e-9):
+        payoffs = np.asarray(payoffs, dtype=float)
+        assert payoffs.ndim>=3 and payoffs.shape[-1]==2
+        A, B = payoffs[...,0], payoffs[...,1]
+        br1 = A >= A.max(axis=-2, keepdims=True) - tol
+        br2 = B >= B.max(axis=-1, keepdims=True) - tol
+        ne = br1 & br2
+        self.payoffs, self.A, self.B, self.tol = payoffs, A, B, tol
+        self.N, self.M = A.shape[-2:]
+        self.sol = {'br1':br1, 'br2':br2, 'ne':ne, 'n_ne':ne.sum(axis=(-2,-1))}
+
+    def supports(self):
+        # pairs of equal size supports, smallest first
+        for k in range(1, min(self.N, self.M)+1):
+            for S1 in combinations(range(self.N), k):
+                for S2 in combinations(range(self.M), k):
+                    yield list(S1), list(S2)
+
+    def indifference(self, P, S, T):
+        # the mix on T, and the payoff v, that leave a player with payoff
+        # matrix P (own strategies in rows) indifferent across rows S:
+        # P[S,T] mix = v, sum(mix) = 1. Batched; singular systems are marked
+        # unsolved rather than raising.
+        k = len(S)
+        lhs = np.zeros(P.shape[:-2] + (k+1, k+1))
+        lhs[...,:k,:k] = P[...,S,:][...,:,T]
+        lhs[...,:k,k] = -1
+        lhs[...,k,:k] = 1
+        rhs = np.zeros(P.shape[:-2] + (k+1,))
+        rhs[...,k] = 1
+        solved = np.abs(np.linalg.det(lhs)) > self.tol
+        lhs[~solved] = np.eye(k+1)
+        z = np.linalg.solve(lhs, rhs[...,None])[...,0]
+        return z[...,:k], z[...,k], solved
+
+    def mixed_ne(self):
+        # Nash equilibria by support enumeration: for each pair of supports,
+        # each player's mix makes the other indifferent across their support,
+        # and no strategy outside it does better. Finds every equilibrium of
+        # a nondegenerate game, pure ones included (supports of size 1).
+        # Returns x (..., K, N), y (..., K, M), v1 and v2 (..., K) and a valid
+        # mask (..., K), one slot per support pair.
+        tol = self.tol
+        xs, ys, v1s, v2s, valid = [], [], [], [], []
+        for S1, S2 in self.supports():
+            y_S, v1, ok1 = self.indifference(self.A, S1, S2)
+            x_S, v2, ok2 = self.indifference(np.swapaxes(self.B, -2, -1), S2, S1)
+            x = np.zeros(self.A.shape[:-1])
+            y = np.zeros(self.A.shape[:-2] + (self.M,))
+            x[...,S1] = x_S
+            y[...,S2] = y_S
+            # no profitable deviation outside the supports
+            u1 = np.einsum('...ij,...j->...i', self.A, y)
+            u2 = np.einsum('...i,...ij->...j', x, self.B)
+            ok = (ok1 & ok2
+                  & (x_S >= -tol).all(axis=-1) & (y_S >= -tol).all(axis=-1)
+                  & (u1 <= v1[...,None] + tol).all(axis=-1)
+                  & (u2 <= v2[...,None] + tol).all(axis=-1))
+            xs.append(x); ys.append(y); v1s.append(v1); v2s.append(v2); valid.append(ok)
+        return (np.stack(xs, axis=-2), np.stack(ys, axis=-2),
+                np.stack(v1s, axis=-1), np.stack(v2s, axis=-1), np.stack(valid, axis=-1))
+
+    def n_mixed_ne(self):
+        # equilibria in which at least one player mixes
+        x, y, v1, v2, valid = self.mixed_ne()
+        mixed = ((x > self.tol).sum(axis=-1) > 1) | ((y > self.tol).sum(axis=-1) > 1)
+        return (valid & mixed).sum(axis=-1)
@@ -0,0 +1,535 @@
+import os
+import json
+import time
+import hashlib
+import argparse
+from math import lcm
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+import utils2 as u2
+from banks import open_bank, write_bank
+
+CHECKPOINT_DIR = '.checkpoints'
+CHUNKSIZE = 250
+SEED = 123
+
+
+# A Grid is the cartesian product of its axes, taken in the order given.
+# An axis is either a list of values or a function of the row built so far
+# (for nested loops whose range depends on an outer loop variable).
+# params maps a finished row to the problem params, where filters rows.
+class Grid:
+    def __init__(self, params=None, where=None, **axes):
+        self.axes = axes
+        self.params = params
+        self.where = where
+    def rows(self, rng):
+        rows = [{}]
+        for k, values in self.axes.items():
+            rows = [r | {k: v} for r in rows for v in (values(r) if callable(values) else values)]
+        return rows
+    def candidates(self, rng):
+        for r in self.rows(rng):
+            if self.where and not self.where(r):
+                continue
+            yield self.params(r) if self.params else r
+
+
+# Draws is n random draws per row of an (optional) outer grid. Each axis is
+# a function of (rng, row) returning one value.
+class Draws(Grid):
+    def __init__(self, n, over=None, params=None, where=None, **axes):
+        Grid.__init__(self, params=params, where=where, **axes)
+        self.n = n
+        self.over = over
+    def rows(self, rng):
+        rows = []
+        for base in (self.over.rows(rng) if self.over else [{}]):
+            for i in range(self.n):
+                r = base.copy()
+                for k, draw in self.axes.items():
+                    r[k] = draw(rng, r)
+                rows.append(r)
+        return rows
+
+
+def grid_params(*keys, **extra):
+    return lambda r: {k: r[k] for k in keys} | {k: (v(r) if callable(v) else v) for k, v in extra.items()}
+
+def rounded_probs(rng, K):
+    p_ = rng.uniform(size=K)
+    p_ = p_/np.sum(p_)
+    p_ = np.round(p_*100)
+    p_[K-1] = 100 - np.sum(p_[0:K-1])
+    return p_/100
+
+def payoff_grid(gametype, layouts, **axes):
+    # one row per (utility values, layout); layouts are functions of the row
+    return Grid(
+        layout=list(range(len(layouts))),
+        params=lambda r: {
+            'players': ['Player 1', 'Player 2'],
+            'strategies': [['A','B'],['A','B']],
+            'gametype': gametype,
+            'payoffs': layouts[r['layout']](r),
+        },
+        **axes,
+    )
+
+def price_change_params(r):
+    if r['axis']=='y':
+        xint, yint1, yint2 = 12*r['xunit'], r['int1'], r['int2']
+        I = lcm(xint, yint1, yint2)
+        px1, px2, py1, py2 = I/xint, I/xint, I/yint1, I/yint2
+        x1, x2 = r['v1'], r['v2']
+    else:
+        xint1, xint2, yint = r['int1'], r['int2'], 12*r['xunit']
+        I = lcm(xint1, xint2, yint)
+        px1, px2, py1, py2 = I/xint1, I/xint2, I/yint, I/yint
+        x1 = (I - py1*r['v1'])/px1
+        x2 = (I - py2*r['v2'])/px2
+    return {'x1':x1,'px1':px1,'py1':py1,'x2':x2,'px2':px2,'py2':py2,'I':I,'xunit':r['xunit'],'xn':13}
+
+def read_bank(TYPE):
+    bank = open_bank(TYPE)
+    return bank.rows(range(len(bank)))
+
+
+# Parameter grids for each bank, transcribed from generate_problems.ipynb.
+# Banks are built in this order, so a grid may read an earlier bank.
+BANK_GRIDS = {
+    'LinearMarketProblem': Grid(
+        a_d=[6,7,8,9,10,11,12],
+        a_s=[0,1,2,3,4],
+        b_d=[1/4,1/3,1/2,2/3,3/4,1],
+        b_s=[1/4,1/3,1/2,2/3,3/4,1],
+        xunit=[1,2,5,10],
+        params=lambda r: {'ad':r['a_d']*r['xunit'], 'bd':r['b_d'], 'as':r['a_s']*r['xunit'], 'bs':r['b_s'], 'xunit':r['xunit'], 'yunit':r['xunit']},
+    ),
+    'ExponentialMarketProblem': Grid(
+        a_s=[1,2,3,4,5,6],
+        a_d=lambda r: np.arange(r['a_s']+1, r['a_s']+7),
+        kd=[-1/4,-1/3,-1/2,-2/3,-3/4,-1],
+        ks=[1/4,1/3,1/2,2/3,3/4,1,3/2,2],
+        params=lambda r: {'ad':r['a_d'],'kd':r['kd'],'as':r['a_s'],'ks':r['ks']},
+    ),
+    'ExponentialRewriteProblem': Grid(
+        a=[2/3, 3/4, 4/3, 3/2, 5/2, 2, 3, 4],
+        k=[-2,-3/2,-3/4,-2/3,-1/2,-1/3,-1/4,1/4,1/3,1/2,2/3,3/4,3/2],
+        y=[0.25, 0.5, 0.75, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+    ),
+    'CobbDouglasSimplifyProblem': Grid(
+        A=[1,2,3,4,6,8,9,12,16,18],
+        B=[1,2,3,4,6,8,9,12,16,18],
+        a=[-3/4,-2/3,-1/2,-1/3,-1/4,1/4,1/3,1/2,2/3,3/4],
+        b=[-3/4,-2/3,-1/2,-1/3,-1/4,1/4,1/3,1/2,2/3,3/4],
+        where=lambda r: (r['A']!=r['B']) and (u2.sign(r['a'])!=u2.sign(r['b'])),
+        params=grid_params('A','B','a','b', x='x', y='y'),
+    ),
+    'LinearConsumerProblem': Draws(1000,
+        a=lambda rng, r: rng.integers(6,25),
+        b=lambda rng, r: rng.integers(1,5),
+        p=lambda rng, r: rng.integers(1,r['a']),
+    ),
+    'LogConsumerProblem': Draws(1000,
+        a=lambda rng, r: rng.integers(6,25),
+        p=lambda rng, r: rng.integers(1,r['a']/np.exp(1)),
+    ),
+    'QuadraticCostFirmProblem': Draws(1000,
+        a=lambda rng, r: rng.integers(0,7),
+        b=lambda rng, r: rng.integers(1,5),
+        p=lambda rng, r: rng.integers(r['a']+1,r['a']+10),
+    ),
+    'QuadraticOptimizationProblem': Draws(1000,
+        a=lambda rng, r: rng.integers(1,25),
+        b=lambda rng, r: rng.integers(1,9),
+        c=lambda rng, r: rng.integers(-50,51),
+        where=lambda r: r['c']!=0,
+    ),
+    'ExponentialOptimizationProblem': Draws(1000,
+        a=lambda rng, r: rng.integers(1,25),
+        p=lambda rng, r: rng.choice([1/4,1/3,1/2,2/3,3/4]),
+        b=lambda rng, r: rng.integers(1,9),
+        c=lambda rng, r: rng.integers(-50,51),
+        where=lambda r: r['c']!=0,
+    ),
+    'LogOptimizationProblem': Draws(1000,
+        a=lambda rng, r: rng.integers(1,25),
+        b=lambda rng, r: rng.integers(1,9),
+        c=lambda rng, r: rng.integers(-50,51),
+        where=lambda r: r['c']!=0,
+    ),
+    'LinearCommodityMarketProblem': Draws(1000,
+        ac=lambda rng, r: rng.integers(6,25),
+        bc=lambda rng, r: rng.integers(1,5),
+        af=lambda rng, r: rng.integers(0,r['ac']-1),
+        bf=lambda rng, r: rng.integers(1,5),
+    ),
+    'ExponentialCommodityMarketProblem': Draws(1000,
+        a=lambda rng, r: rng.integers(6,25),
+        b=lambda rng, r: rng.integers(1,r['a']-4),
+    ),
+    'WorkerProblem': Grid(
+        d=[1/4, 1/3, 1/2, 2/3, 3/4, 1, 3/2],
+        k=[4/3, 3/2, 2],
+        w=np.arange(1,9),
+    ),
+    'ExponentialProductionFirmProblem': Grid(
+        A=[1,2,3,4,5,6],
+        k=[1/4,1/3,1/2,2/3,3/4],
+        w=np.arange(1,9),
+        p=np.arange(1,9),
+    ),
+    'ExponentialLaborMarketProblem': Grid(
+        d=[2/3, 4/3],
+        A=lambda r: np.array([1,2,3,4])*(3*r['d']),
+        p=np.arange(1,9),
+        params=grid_params('A','d','p', kf=1/2, kw=3/2),
+    ),
+    'GeneralEquilibriumProblem': Grid(
+        d=[1/2, 1, 3/2],
+        a=lambda r: np.array([1,2,3,4,6,7,8,9])*(4*r['d']),
+        A=np.arange(2,8,2),
+        params=grid_params('A','d','a', kf=1/2, kw=2),
+    ),
+    'ProductivityShockProblem': Grid(
+        row=lambda r: read_bank('GeneralEquilibriumProblem'),
+        A2=lambda r: np.array([1.5, 2, 2.5, 3])*r['row']['A'],
+        params=lambda r: r['row'] | {'A1':r['row']['A'], 'A2':r['A2']},
+    ),
+    'LinearContourProblem': Grid(
+        a=range(1,5),
+        b=range(1,5),
+        xunit=[1,2,5,10],
+        z=lambda r: np.arange(3,7)*(r['a']+r['b'])*r['xunit'],
+        params=grid_params('a','b','z','xunit', yunit=lambda r: r['xunit']),
+    ),
+    'CBDerivativeProblem': Draws(5,
+        over=Grid(A=np.arange(1,25)),
+        a=lambda rng, r: rng.choice([1/4,1/3,1/2,2/3,3/4]),
+        b=lambda rng, r: 1-r['a'],
+    ),
+    'CobbDouglasConsumerProblem': Grid(
+        xunit=[1,2,5,10],
+        px=range(1,7),
+        py=range(1,7),
+        I=lambda r: np.array([6,7,8,9,10,11,12])*r['xunit']*np.minimum(r['px'],r['py']),
+        a=[1/4,1/3,1/2,2/3,3/4],
+        params=grid_params('a','px','py','I','xunit', b=lambda r: 1-r['a'], yunit=lambda r: r['xunit']),
+    ),
+    'PerfectSubstitutesProblem': Grid(
+        xunit=[1,5,10],
+        px=range(1,6),
+        py=range(1,6),
+        I=lambda r: np.array([6,7,8,9,10,11,12])*r['xunit']*np.minimum(r['px'],r['py']),
+        a=[1,2,3,4,5],
+        b=[1,2,3,4,5],
+        params=grid_params('a','b','px','py','I','xunit', yunit=lambda r: r['xunit']),
+    ),
+    'PerfectComplementsProblem': Grid(
+        xunit=[1,5,10],
+        px=range(1,6),
+        py=range(1,6),
+        I=lambda r: np.array([6,7,8,9,10,11,12])*r['xunit']*np.minimum(r['px'],r['py']),
+        params=grid_params('px','py','I','xunit', yunit=lambda r: r['xunit']),
+    ),
+    'PriceChangeProblem': Grid(
+        xunit=[1,5,10],
+        axis=['y','x'],  # which intercept changes with the price
+        int1=lambda r: np.arange(3*r['xunit'], 13*r['xunit'], r['xunit']),
+        int2=lambda r: np.arange(3*r['xunit'], 13*r['xunit'], r['xunit']),
+        v1=lambda r: np.arange(2*r['xunit'], 11*r['xunit'], r['xunit']),
+        v2=lambda r: np.arange(2*r['xunit'], 11*r['xunit'], r['xunit']),
+        where=lambda r: r['int1']!=r['int2'],
+        params=price_change_params,
+    ),
+    'PublicSchoolProblem': Grid(
+        xunit=[1,5,10],
+        xint=lambda r: np.arange(6,13)*r['xunit'],
+        yint=lambda r: np.arange(6,13)*r['xunit'],
+        x_private=lambda r: np.arange(2*r['xunit'], r['xint']-r['xunit'], r['xunit']),
+        x_public=lambda r: np.arange(2*r['xunit'], r['xint']-r['xunit'], r['xunit']),
+        params=grid_params('x_private','x_public','xunit', px=lambda r: 1200/r['xint'], py=lambda r: 1200/r['yint'], I=1200, xn=13),
+    ),
+    'CobbDouglasWorkerProblem': Grid(
+        x=np.arange(15,50,5),
+        w=np.arange(15,55,5),
+        yint_i=np.arange(6,13),
+        params=grid_params('w','x', yunit=lambda r: 60*r['w']/r['yint_i']),
+    ),
+    'WageChangeProblem': Grid(
+        w1=np.arange(15,65,5),
+        w2=np.arange(15,65,5),
+        x1=np.arange(5,60,5),
+        x2=np.arange(5,60,5),
+        where=lambda r: r['w1']!=r['w2'],
+    ),
+    'IncomeSupportProblem': Grid(
+        x=np.arange(15,50,5),
+        w=np.arange(10,30,5),
+        ymin=lambda r: np.arange(60*r['w']/12, 7*60*r['w']/12, 60*r['w']/12),
+        params=grid_params('w','x','ymin', yunit=lambda r: 60*r['w']/12),
+    ),
+    'ReturnsToScaleProblem': Grid(
+        A=[1,2,3,4,5,6,7,8],
+        a=[1/4,1/3,1/2,2/3,3/4],
+        b=[1/4,1/3,1/2,2/3,3/4],
+        delta=[-0.5,-0.25,-0.1,0.1,0.25,0.5,0.75,1.00],
+    ),
+    'CobbDouglasFirmProblem': Grid(
+        A=[1/4, 1/2, 1, 2, 4],
+        a=[1/4, 1/3, 1/2, 2/3, 3/4],
+        w=np.arange(1,6),
+        r=np.arange(1,6),
+    ),
+    'CobbDouglasFirmGraphicalProblem': Grid(
+        L=np.arange(3,10),
+        K=np.arange(3,10),
+        w=np.arange(1,6),
+        r=np.arange(1,6),
+        params=grid_params('L','K','w','r', xunit=1),
+    ),
+    'TechnicalChangeProblem': Grid(
+        A1=[2,4,6],
+        A2=[2,4,6],
+        a1=[1/3,1/2,2/3],
+        a2=[1/3,1/2,2/3],
+        where=lambda r: (r['A1']!=r['A2']) or (r['a1']!=r['a2']),
+    ),
+    'NormalFormProblem': [
+        payoff_grid("Prisoner's Dilemma", [
+                lambda r: [[[r['ugood'],r['ugood']],[r['uworst'],r['ubest']]], [[r['ubest'],r['uworst']],[r['ubad'],r['ubad']]]],
+                lambda r: [[[r['uworst'],r['ubest']],[r['ugood'],r['ugood']]], [[r['ubad'],r['ubad']],[r['ubest'],r['uworst']]]],
+                lambda r: [[[r['ubest'],r['uworst']],[r['ubad'],r['ubad']]], [[r['ugood'],r['ugood']],[r['uworst'],r['ubest']]]],
+                lambda r: [[[r['ubad'],r['ubad']],[r['ubest'],r['uworst']]], [[r['uworst'],r['ubest']],[r['ugood'],r['ugood']]]],
+            ],
+            ubest=np.arange(3,10),
+            ugood=lambda r: np.arange(2,r['ubest']),
+            ubad=lambda r: np.arange(1,r['ugood']),
+            uworst=lambda r: np.arange(0,r['ubad']),
+        ),
+        payoff_grid("Stag Hunt", [
+                lambda r: [[[r['ustag'],r['ustag']],[r['uworst'],r['urabbit']]], [[r['urabbit'],r['uworst']],[r['urabbit'],r['urabbit']]]],
+                lambda r: [[[r['uworst'],r['urabbit']],[r['ustag'],r['ustag']]], [[r['urabbit'],r['urabbit']],[r['urabbit'],r['uworst']]]],
+                lambda r: [[[r['urabbit'],r['uworst']],[r['urabbit'],r['urabbit']]], [[r['ustag'],r['ustag']],[r['uworst'],r['urabbit']]]],
+                lambda r: [[[r['urabbit'],r['urabbit']],[r['urabbit'],r['uworst']]], [[r['uworst'],r['urabbit']],[r['ustag'],r['ustag']]]],
+            ],
+            ustag=np.arange(2,10),
+            urabbit=lambda r: np.arange(1,r['ustag']),
+            uworst=lambda r: np.arange(0,r['urabbit']),
+        ),
+        payoff_grid("Chicken", [
+                lambda r: [[[r['ubest'],r['ubad']],[r['uworst'],r['uworst']]], [[r['ugood'],r['ugood']],[r['ubad'],r['ubest']]]],
+                lambda r: [[[r['uworst'],r['uworst']],[r['ubest'],r['ubad']]], [[r['ubad'],r['ubest']],[r['ugood'],r['ugood']]]],
+                lambda r: [[[r['ugood'],r['ugood']],[r['ubad'],r['ubest']]], [[r['ubest'],r['ubad']],[r['uworst'],r['uworst']]]],
+                lambda r: [[[r['ubad'],r['ubest']],[r['ugood'],r['ugood']]], [[r['uworst'],r['uworst']],[r['ubest'],r['ubad']]]],
+            ],
+            ubest=np.arange(3,10),
+            ugood=lambda r: np.arange(2,r['ubest']),
+            ubad=lambda r: np.arange(1,r['ugood']),
+            uworst=lambda r: np.arange(0,r['ubad']),
+        ),
+        payoff_grid("Rock Paper Scissors", [
+                lambda r: [[[r['uwin'],r['ulose']],[r['ulose'],r['uwin']]], [[r['ulose'],r['uwin']],[r['uwin'],r['ulose']]]],
+                lambda r: [[[r['ulose'],r['uwin']],[r['uwin'],r['ulose']]], [[r['uwin'],r['ulose']],[r['ulose'],r['uwin']]]],
+            ],
+            uwin=np.arange(1,10),
+            ulose=lambda r: np.arange(-r['uwin'],r['uwin']),
+        ),
+    ],
+    'MonopolyProblem': Grid(
+        alpha=np.arange(6,49,2),
+        f=np.arange(0,33,2),
+        a=lambda r: np.arange(0,r['alpha']-6,2),
+        b=[0.5, 1],
+        params=grid_params('alpha','a','b','f', beta=1),
+    ),
+    'PriceDiscriminationProblem': Grid(
+        alphaA=np.arange(6,37,2),
+        betaA=[0.5, 1, 2],
+        alphaB=np.arange(6,37,2),
+        betaB=[0.5, 1, 2],
+        c=np.arange(1,6),
+    ),
+    'Cournot2Problem': Grid(
+        alpha=np.arange(6,37),
+        a1=np.arange(0,7),
+        a2=np.arange(0,7),
+        b1=[0,1,2],
+        b2=[0,1,2],
+        where=lambda r: not (((r['a1']==0) and (r['b1']==0)) or ((r['a2']==0) and (r['b2']==0))),
+        params=grid_params('alpha','a1','b1','a2','b2', beta=1),
+    ),
+    'CournotNProblem': Grid(
+        alpha=np.arange(6,37),
+        mc=lambda r: np.arange(1,r['alpha']-4),
+        N=[2,3,4,5,6,7,8,9,10,20,30,40,50,100],
+        params=grid_params('alpha','mc','N', beta=1),
+    ),
+    'ExpectedValueProblem': Draws(1000,
+        K=lambda rng, r: rng.integers(3,5),
+        x=lambda rng, r: rng.integers(1,10,size=r['K']),
+        p=lambda rng, r: rounded_probs(rng, r['K']),
+        params=grid_params('x','p'),
+    ),
+    'InsuranceProblem': Grid(
+        W0=np.arange(100,10100,100),
+        D=lambda r: np.array([0.1, 0.2, 0.25, 0.3, 0.4, 0.5])*r['W0'],
+        p=np.array([0.1, 0.15, 0.2, 0.25, 0.3, 0.35, 0.4, 0.45, 0.5]),
+        fun=['ln', 'sqrt'],
+    ),
+    'PresentValueProblem': Draws(20,
+        over=Grid(beta=[0.8, 0.9, 0.95, 0.98, 0.99], T=[0, 10, 20, 30, np.inf]),
+        x=lambda rng, r: rng.integers(10,101,size=3) if r['T']==0 else rng.choice(np.arange(100,1100,100)),
+    ),
+    'SavingsProblem': Grid(
+        beta=[0.8, 0.85, 0.9, 0.95, 0.98, 0.99],
+        p=[0.8, 0.85, 0.9, 0.95, 0.98, 0.99],
+        Y=np.array([10,20,30,40,50,60,70,80,90,100])*1000,
+    ),
+}
+
+def to_builtin(x):
+    if isinstance(x, dict):
+        return {k: to_builtin(v) for k, v in x.items()}
+    if isinstance(x, (list, tuple)):
+        return [to_builtin(v) for v in x]
+    if isinstance(x, np.ndarray):
+        return to_builtin(x.tolist())
+    if isinstance(x, np.generic):
+        return x.item()
+    return x
+
+def get_candidates(TYPE, seed=SEED):
+    rng = np.random.default_rng(seed)
+    grids = BANK_GRIDS[TYPE]
+    if not isinstance(grids, list):
+        grids = [grids]
+    return [to_builtin(params) for grid in grids for params in grid.candidates(rng)]
+
+def get_chunks(candidates, chunksize):
+    it = iter(candidates)
+    return list(iter(lambda: list(islice(it, chunksize)), []))
+
+def solve_chunk(TYPE, chunk, seed):
+    rng = np.random.default_rng(seed)
+    data = []
+    for params in chunk:
+        problem = u2.load_feasible_problem(TYPE, params=params, rng=rng)
+        if problem is not None:
+            data.append( to_builtin(problem.params | problem.sol) )
+    return data
+
+
+class Checkpoint:
+    # Solved chunks are written as they finish, one json file per chunk.
+    # The digest of the candidate list guards against resuming a stale run.
+    def __init__(self, TYPE, candidates, chunksize, path=CHECKPOINT_DIR):
+        self.path = os.path.join(path, TYPE)
+        self.meta = {
+            'TYPE': TYPE,
+            'chunksize': chunksize,
+            'n_candidates': len(candidates),
+            'digest': hashlib.sha1(json.dumps(candidates).encode()).hexdigest(),
+        }
+    def chunk_file(self, i):
+        return os.path.join(self.path, f"{i:05d}.json")
+    def open(self, resume=True):
+        meta_file = os.path.join(self.path, 'meta.json')
+        if resume and os.path.exists(meta_file):
+            with open(meta_file) as f:
+                if json.load(f)==self.meta:
+                    return self
+        self.clear()
+        os.makedirs(self.path)
+        self.write(meta_file, self.meta)
+        return self
+    def done(self, i):
+        return os.path.exists(self.chunk_file(i))
+    def save(self, i, data):
+        self.write(self.chunk_file(i), data)
+    def load(self, i):
+        with open(self.chunk_file(i)) as f:
+            return json.load(f)
+    def clear(self):
+        if os.path.exists(self.path):
+            for file in os.listdir(self.path):
+                os.remove(os.path.join(self.path, file))
+            os.rmdir(self.path)
+    def write(self, file, obj):
+        tmp = file + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(obj, f)
+        os.replace(tmp, file)
+
+
+def build_bank(TYPE, workers=None, chunksize=CHUNKSIZE, seed=SEED, resume=True, executor=None):
+    candidates = get_candidates(TYPE, seed=seed)
+    chunks = get_chunks(candidates, chunksize)
+    checkpoint = Checkpoint(TYPE, candidates, chunksize).open(resume=resume)
+    todo = [i for i in range(len(chunks)) if not checkpoint.done(i)]
+    n_solved = sum(len(chunks[i]) for i in todo)
+    n_rows = 0
+    start = time.perf_counter()
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {executor.submit(solve_chunk, TYPE, chunks[i], [seed, i]): i for i in todo}
+        for future in as_completed(futures):
+            data = future.result()
+            checkpoint.save(futures[future], data)
+            n_rows += len(data)
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
+    elapsed = time.perf_counter() - start
+    data = [row for i in range(len(chunks)) for row in checkpoint.load(i)]
+    write_bank(TYPE, data)
+    checkpoint.clear()
+    stats = {
+        'TYPE': TYPE,
+        'rows': len(data),
+        'candidates': len(candidates),
+        'resumed_chunks': len(chunks) - len(todo),
+        'seconds': elapsed,
+        'rows_per_sec': n_rows/elapsed if elapsed>0 else np.nan,
+        'candidates_per_sec': n_solved/elapsed if elapsed>0 else np.nan,
+    }
+    return stats
+
+def build_banks(types=None, workers=None, chunksize=CHUNKSIZE, seed=SEED, resume=True, verbose=True):
+    if not types:
+        types = list(BANK_GRIDS.keys())
+    for TYPE in types:
+        if TYPE not in u2.PROBLEM_TYPES:
+            raise KeyError(f"{TYPE} is not in PROBLEM_TYPES")
+        if TYPE not in BANK_GRIDS:
+            raise KeyError(f"{TYPE} has no parameter grid")
+    # types are built in BANK_GRIDS order so dependent banks come last
+    types = [TYPE for TYPE in BANK_GRIDS.keys() if TYPE in types]
+    report = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for TYPE in types:
+            stats = build_bank(TYPE, chunksize=chunksize, seed=seed, resume=resume, executor=executor)
+            report.append(stats)
+            if verbose:
+                print(f"{TYPE}: {stats['rows']:,} rows from {stats['candidates']:,} candidates "
+                      f"in {stats['seconds']:.1f}s ({stats['rows_per_sec']:,.0f} rows/sec, "
+                      f"{stats['resumed_chunks']} chunks resumed)")
+    return pd.DataFrame(report)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Build the problem banks used by the practice notebooks.")
+    parser.add_argument('types', nargs='*', help="problem types to build (default: all)")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--chunksize', type=int, default=CHUNKSIZE)
+    parser.add_argument('--seed', type=int, default=SEED)
+    parser.add_argument('--restart', action='store_true', help="ignore existing checkpoints")
+    args = parser.parse_args()
+    build_banks(args.types, workers=args.workers, chunksize=args.chunksize, seed=args.seed, resume=not args.restart)
@@ -0,0 +1,166 @@
+import os
+import re
+import json
+import gzip
+import zlib
+import hashlib
+from itertools import accumulate
+
+###################################################################
+# PRACTICE BANKS
+# The problems rpg.py deals are written to assets/data as:
+#   <lec>-practice.json:       the whole bank, one JSON array
+#   <lec>-practice.jsonl:      the same problems, one JSON object per line
+#   <lec>-practice.jsonl.z:    each line deflated on its own (zlib format)
+#                              with a preset dictionary, back to back
+#   <lec>-practice.zdict.gz:   the dictionary, a sample of the lines, gzipped
+#   <lec>-practice.defs.svg.gz: the svg glyphs, markers and clip paths the
+#                              problems use, gzipped, if they use any
+#   <lec>-practice.live.json.gz: specs for problems rpg.py builds live
+#                              with core.live_problem, gzipped, if any
+#   <lec>-practice.index.json: {"n", "size", "offsets", "zlib"}, where
+#                              problem i is bytes offsets[i] to
+#                              offsets[i+1]-1 of the .jsonl, and "zlib"
+#                              has the same for the .jsonl.z
+# With the index, the page fetches one problem with an HTTP Range
+# request, so what it downloads and parses per problem doesn't grow
+# with the bank. Problems from one notebook share almost all their
+# text, so against the dictionary each deflates to a few dozen bytes.
+# The .z and .gz files are served as is, with no Content-Encoding, so
+# ranges into them work on any static host, and the worker decodes them.
+# Pre-typeset math and inlined graphs define their glyphs once per problem,
+# which would outweigh the rest of a line many times over. The .json,
+# .jsonl and .jsonl.z leave those defs out and only <use> them, and the
+# page adds the bank's .defs.svg once; read_practice puts them back.
+# A live spec, from utils2.live_spec, is {"type", "n", "setup_id",
+# "question_ids", "params"}, with params a few bank columns of values.
+# It fills n more places in the bank, and each time one is dealt the
+# page builds a fresh problem from a random row of params; the index's
+# "live" is the number of those places.
+# manifest.json records the size and sha256 of every file written,
+# and only the files a bank was last written as.
+###################################################################
+
+MANIFEST = 'manifest.json'
+ZDICT_SIZE = 32768
+ZDICT_SAMPLES = 16
+SVG_DEF = re.compile(r'<path id="([^"]+)"[^>]*/>|<clipPath id="([^"]+)">.*?</clipPath>', re.S)
+SVG_ELEMENT = re.compile(r'(<svg\b[^>]*>)(.*?</svg>)', re.S)
+SVG_REF = re.compile(r'href="#([^"]+)"|url\(#([^)]+)\)')
+SVG_NS = 'xmlns="http://www.w3.org/2000/svg" xmlns:xlink="http://www.w3.org/1999/xlink"'
+
+def practice_paths(json_file):
+    base = json_file[:-len('.json')] if json_file.endswith('.json') else json_file
+    return (base + '.json', base + '.jsonl', base + '.jsonl.z', base + '.zdict.gz', base + '.index.json',
+            base + '.defs.svg.gz', base + '.live.json.gz')
+
+def write_atomic(path, data):
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def update_manifest(root, files, bank=None):
+    # files is {name: data}; if bank is given, entries for that bank's
+    # other files, e.g. from an older format, are dropped
+    path = os.path.join(root, MANIFEST)
+    manifest = {}
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            manifest = json.load(f)
+    if bank is not None:
+        manifest = {name: entry for name, entry in manifest.items()
+                    if name in files or not name.startswith(bank + '.')}
+    for name, data in files.items():
+        manifest[name] = {'bytes': len(data), 'sha256': hashlib.sha256(data).hexdigest()}
+    write_atomic(path, json.dumps(manifest, indent=1, sort_keys=True).encode())
+
+def get_offsets(chunks):
+    return [0] + list(accumulate(len(chunk) for chunk in chunks))
+
+def get_zdict(lines):
+    # evenly spaced lines, up to zlib's 32K window; deflate finds matches
+    # nearer the end of the dictionary more cheaply, so the first sample goes last
+    zdict = b''
+    for line in lines[::max(1, len(lines)//ZDICT_SAMPLES)]:
+        if len(zdict) + len(line) <= ZDICT_SIZE:
+            zdict = line + zdict
+    return zdict
+
+def deflate(line, zdict):
+    c = zlib.compressobj(9, zdict=zdict)
+    return c.compress(line) + c.flush()
+
+def hoist_svg_defs(prob, defs):
+    # prob without its svg defs, which are added to defs by id
+    def hoist(m):
+        defs.setdefault(m.group(1) or m.group(2), m.group(0))
+        return ''
+    return {key: re.sub(r'<defs>\s*</defs>', '', SVG_DEF.sub(hoist, value)) if isinstance(value, str) else value
+            for key, value in prob.items()}
+
+def restore_svg_defs(prob, defs):
+    # puts each def back in the first svg of prob that uses it
+    seen = set()
+    def restore(m):
+        used = [a or b for a, b in SVG_REF.findall(m.group(2))]
+        new = [key for key in dict.fromkeys(used) if key in defs and key not in seen]
+        seen.update(new)
+        if not new:
+            return m.group(0)
+        return m.group(1) + '<defs>' + ''.join(defs[key] for key in new) + '</defs>' + m.group(2)
+    return {key: SVG_ELEMENT.sub(restore, value) if isinstance(value, str) else value
+            for key, value in prob.items()}
+
+def write_practice(probs, json_file, live=None):
+    paths = practice_paths(json_file)
+    defs = {}
+    probs = [hoist_svg_defs(prob, defs) for prob in probs]
+    lines = [json.dumps(prob).encode() + b'\n' for prob in probs]
+    zdict = get_zdict(lines)
+    deflated = [deflate(line, zdict) for line in lines]
+    offsets = get_offsets(lines)
+    z_offsets = get_offsets(deflated)
+    index = {
+        'n': len(lines), 'size': offsets[-1], 'offsets': offsets,
+        'zlib': {'size': z_offsets[-1], 'offsets': z_offsets},
+    }
+    if defs:
+        index['defs'] = True
+    if live:
+        index['live'] = sum(spec['n'] for spec in live)
+    files = [
+        json.dumps(probs).encode(), b''.join(lines), b''.join(deflated),
+        gzip.compress(zdict, compresslevel=9, mtime=0), json.dumps(index).encode(),
+    ]
+    # the optional files, None where the bank has none
+    svg = f'<svg {SVG_NS} width="0" height="0" style="position: absolute"><defs>{"".join(defs.values())}</defs></svg>'
+    files.append(gzip.compress(svg.encode(), compresslevel=9, mtime=0) if defs else None)
+    files.append(gzip.compress(json.dumps(live).encode(), compresslevel=9, mtime=0) if live else None)
+    written = {}
+    for path, data in zip(paths, files):
+        if data is not None:
+            write_atomic(path, data)
+            written[os.path.basename(path)] = data
+        elif os.path.exists(path):
+            os.remove(path)
+    update_manifest(os.path.dirname(paths[0]), written, bank=os.path.basename(paths[0])[:-len('.json')])
+    return paths[0]
+
+def read_practice(json_file):
+    paths = practice_paths(json_file)
+    with open(paths[0], 'r') as f:
+        probs = json.load(f)
+    if os.path.exists(paths[5]):
+        with gzip.open(paths[5], 'rt') as f:
+            defs = {m.group(1) or m.group(2): m.group(0) for m in SVG_DEF.finditer(f.read())}
+        probs = [restore_svg_defs(prob, defs) for prob in probs]
+    return probs
+
+def read_live(json_file):
+    # the bank's live specs, or None
+    path = practice_paths(json_file)[6]
+    if not os.path.exists(path):
+        return None
+    with gzip.open(path, 'rt') as f:
+        return json.load(f)
@@ -0,0 +1,37 @@
+import os
+import glob
+import argparse
+
+import utils2 as u2
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'assets', 'data')
+
+
+# Rewrites the practice banks read by rpg.py with their math pre-typeset.
+# Entries whose math was all typeset get 'typeset': true, and rpg.py
+# shows those without calling MathJax. Entries that are already typeset
+# are left as they are. The bank's live specs are kept, and the problems
+# rpg.py builds from them are typeset by MathJax.
+def typeset_bank(filename):
+    probs = u2.read_practice(filename)
+    probs = [prob if prob.get('typeset') else u2.typeset_math(prob) for prob in probs]
+    u2.write_practice(probs, filename, live=u2.read_live(filename))
+    return probs
+
+def typeset_banks(lectures=None, data_dir=DATA_DIR, verbose=True):
+    if lectures:
+        filenames = [os.path.join(data_dir, f"{lec}-practice.json") for lec in lectures]
+    else:
+        filenames = sorted(glob.glob(os.path.join(data_dir, '*-practice.json')))
+    for filename in filenames:
+        probs = typeset_bank(filename)
+        if verbose:
+            n = sum(prob['typeset'] for prob in probs)
+            print(f"{os.path.basename(filename)}: {n} of {len(probs)} problems fully typeset")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Pre-typeset the math in the practice banks.")
+    parser.add_argument('lectures', nargs='*', help="lectures to typeset, e.g. consumer-theory (default: all)")
+    args = parser.parse_args()
+    typeset_banks(args.lectures)
@@ -0,0 +1,184 @@
+// Main-thread side of the random problem generator. Pyodide boots, and
+// rpg.py loads banks and deals problems, in a web worker, so the page
+// stays responsive; this side only sends requests and updates the DOM.
+import { PyWorker } from "https://pyscript.net/releases/2024.1.1/core.js";
+
+performance.mark("rpg:start");
+
+// caches the runtime, the page and the banks for repeat and offline visits
+if ("serviceWorker" in navigator) {
+  navigator.serviceWorker.register("/CSUN-Econ-310/sw.js", { scope: "/CSUN-Econ-310/rpg/" }).catch(() => {});
+}
+
+const dropdown = document.getElementById("dropdown");
+const button = document.getElementById("button");
+const problem = document.getElementById("problem");
+const solution = document.getElementById("solution");
+const nextProblem = document.getElementById("next-problem");
+const nextSolution = document.getElementById("next-solution");
+const loading = document.getElementById("loading");
+
+const worker = PyWorker("/CSUN-Econ-310/rpg.py", { config: "/CSUN-Econ-310/rpg.toml" });
+
+// requests waiting for the worker's reply, by id
+const waiting = new Map();
+let lastId = 0;
+let started;
+const ready = new Promise(resolve => { started = resolve; });
+
+worker.onmessage = ({ data }) => {
+  if (data.type === "ready") {
+    performance.mark("rpg:ready");
+    console.log(`rpg rpg:ready: ${performance.now().toFixed(0)} ms`);
+    started();
+  } else if (data.type === "store") {
+    try { localStorage.setItem(data.key, data.value); } catch (e) {}
+  } else if (waiting.has(data.id)) {
+    const { resolve, reject } = waiting.get(data.id);
+    waiting.delete(data.id);
+    data.ok ? resolve(data) : reject(new Error(data.error));
+  }
+};
+
+function send(msg) {
+  const id = ++lastId;
+  return new Promise((resolve, reject) => {
+    waiting.set(id, { resolve, reject });
+    worker.postMessage({ ...msg, id });
+  });
+}
+
+async function call(type, lec) {
+  await ready;
+  return send({ type, lec });
+}
+
+// lectures whose bank the worker has fetched; until then, a request the
+// student is waiting on shows the #loading dialog
+const fetched = new Set();
+let waitingOn = 0;
+
+async function whileLoading(lec, request) {
+  if (fetched.has(lec)) return request;
+  if (waitingOn++ === 0 && !loading.open) loading.showModal();
+  try {
+    return await request;
+  } finally {
+    if (--waitingOn === 0) loading.close();
+  }
+}
+
+// problems the worker has dealt but the page hasn't shown, by lecture
+const held = {};
+
+async function deal(lec) {
+  if (lec in held) {
+    const prob = held[lec];
+    delete held[lec];
+    return prob;
+  }
+  const reply = await whileLoading(lec, call("deal", lec));
+  fetched.add(lec);
+  // the bank's svg glyphs, sent with the first problem that uses them
+  if (reply.defs) document.body.insertAdjacentHTML("beforeend", reply.defs);
+  return reply.problem;
+}
+
+// banks run through _workspace/typeset_banks.py arrive with their math
+// already typeset as inline svg
+function writeProblem(prob, problemEl, solutionEl) {
+  problemEl.innerHTML = prob.setup;
+  solutionEl.innerHTML = prob.solution;
+  return prob.typeset ? Promise.resolve() : MathJax.typesetPromise([problemEl, solutionEl]);
+}
+
+// The problem the next click will show is dealt and typeset in the
+// off-screen #next-problem and #next-solution while the current one is
+// being worked on, so the click only has to move it into place. If it
+// isn't ready yet the click falls back to typesetting on screen.
+let next = null;
+let rendering = Promise.resolve();
+
+function prefetch(lec) {
+  if (next && next.lec === lec) return;
+  if (next && next.prob) held[next.lec] = next.prob;
+  const entry = { lec, prob: null, ready: false };
+  next = entry;
+  entry.dealt = deal(lec).then(prob => {
+    if (next !== entry) {
+      if (prob) held[lec] = prob;
+      return;
+    }
+    entry.prob = prob;
+    if (!prob) return;
+    // one typeset of the off-screen containers at a time
+    rendering = rendering
+      .then(() => next === entry ? writeProblem(prob, nextProblem, nextSolution) : null)
+      .then(() => { entry.ready = next === entry; })
+      .catch(() => {});
+  }).catch(() => {});
+}
+
+async function showProblem(lec) {
+  let prob;
+  let swap = false;
+  if (next && next.lec === lec) {
+    const entry = next;
+    await entry.dealt;
+    next = null;
+    prob = entry.prob;
+    swap = entry.ready;
+  } else {
+    prob = await deal(lec);
+  }
+
+  if (prob && swap) {
+    problem.replaceChildren(...nextProblem.childNodes);
+    solution.replaceChildren(...nextSolution.childNodes);
+  } else if (prob) {
+    writeProblem(prob, problem, solution);
+  } else {
+    problem.innerHTML = "Sorry, there aren't any practice problems for this week yet!";
+    solution.innerHTML = "";
+  }
+
+  document.getElementById("details").removeAttribute("open");
+
+  prefetch(lec);
+}
+
+// quiet: the lecture selected when the page opens is fetched in the
+// background, so the page isn't covered while the worker boots
+async function selectLecture(lec, quiet = false) {
+  const request = call("select", lec);
+  await (quiet ? request : whileLoading(lec, request));
+  fetched.add(lec);
+  if (dropdown.value === lec) prefetch(lec);
+}
+
+dropdown.addEventListener("change", () => selectLecture(dropdown.value));
+
+button.addEventListener("click", async () => {
+  button.disabled = true;
+  try {
+    await showProblem(dropdown.value);
+  } finally {
+    button.disabled = false;
+  }
+});
+
+// the worker gets the dropdown's lectures and the saved shuffle bags,
+// since it can't read the page or localStorage, then the lecture selected
+// when the page opens is fetched right away
+const store = {};
+try {
+  for (let i = 0; i < localStorage.length; i++) {
+    const key = localStorage.key(i);
+    if (key.startsWith("rpg-bag-")) store[key] = localStorage.getItem(key);
+  }
+} catch (e) {}
+ready.then(() => send({
+  type: "init",
+  lectures: Array.from(dropdown.options, option => option.value),
+  store,
+})).then(() => selectLecture(dropdown.value, true));
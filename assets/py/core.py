@@ -0,0 +1,970 @@
+import numpy as np
+from rationals import rational, is_rational, is_divisible
+
+###################################################################
+# CORE
+# The pure-computation part of utils2: the math utilities, Line,
+# BudgetConstraint, the economic models with their setup() text, and
+# the question text of the problems that can be generated live. Imports
+# only numpy and rationals, with no matplotlib, TeX or econtools, so
+# rpg.py can load it in the browser, where it lives with rationals in
+# assets/py. utils2 re-exports the models and utilities.
+###################################################################
+
+###################################################################
+# MATH UTILITIES
+###################################################################
+def sign(x):
+    if x>0: return '+'
+    else: return '-'
+
+def equals(x,y,tol=1e-4):
+    return np.abs(x-y)<tol
+
+def asfrac(x, inline=False, maxdenom=8, rmplus=True, rmneg=False):
+    if not is_rational(x, maxdenom):
+        return f'{x:g}'
+    f = rational(x)
+    d = f.denominator
+    n = np.abs(f.numerator)
+    out = sign(x)
+    if d==1: out+=f'{n}'
+    elif inline: out+=fr'{n}/{d}'
+    else: out+=fr'\frac{{{n}}}{{{d}}}'
+    if out[0]=='+' and rmplus: out=out[1:]
+    elif out[0]=='-' and rmneg: out=out[1:]
+    return out
+    
+class PTerm:
+    # cx^p
+    def __init__(self,c=1,x='x',p=0.5):
+        self.c = c
+        self.x = x
+        self.p = p
+    def print(self, maxdenom=8, rmplus=True, rmneg=False):
+        c = asfrac(self.c, inline=False, maxdenom=maxdenom, rmplus=rmplus, rmneg=rmneg)
+        p = asfrac(self.p, inline=True, maxdenom=maxdenom, rmplus=True, rmneg=False)
+        if self.c==0: return ''
+        if self.p==0: return c
+        if self.p==1: xp = fr'{self.x}'
+        else: xp = fr'{self.x}^{{{p}}}'
+        if self.c==-1: out = fr'-{xp}'
+        elif self.c==1: out = fr'+{xp}'
+        else: out = fr'{c}{xp}'
+        if out[0]=='+' and rmplus: out=out[1:]
+        elif out[0]=='-' and rmneg: out=out[1:]
+        return out
+    def __repr__(self):
+        return self.print()
+
+class PolyEq:
+    def __init__(self, c=[1,1,1], x='x', p=[0,1,2]):
+        assert len(c)==len(p)
+        assert type(x)==str or len(x)==len(c)
+        if type(x)==str:
+            x = [x]*len(c)
+        self.c = c
+        self.x = x
+        self.p = p
+    def print(self, maxdenom=8, rmplus=True, rmneg=False):
+        out = ''
+        for i in range(len(self.c)):
+            pterm = PTerm(self.c[i], self.x[i], self.p[i])
+            out+=fr'{pterm.print(maxdenom=maxdenom, rmplus=False, rmneg=False)}'
+        if out[0]=='+' and rmplus: out=out[1:]
+        elif out[0]=='-' and rmneg: out=out[1:]
+        return out
+    def __repr__(self):
+        return self.print()
+
+class CobbDouglas:
+    def __init__(self, A=1, x='x', a=1/2, y='y', b=1/2):
+        self.A, self.x, self.a, self.y, self.b = A, x, a, y, b
+        self.bad=False
+    def print(self, maxdenom=8, rmplus=True, rmneg=False):
+        out = PTerm(self.A, self.x, self.a).print(maxdenom=maxdenom,rmplus=rmplus,rmneg=rmneg)
+        out+= PTerm(1, self.y, self.b).print(maxdenom=maxdenom,rmplus=True,rmneg=True)
+        return out
+    def eval_at(self, x, y):
+        A, a, b = self.A, self.a, self.b
+        return A*(x**a)*(y**b)
+    def get_IC(self, U, xg):
+        A, a, b = self.A, self.a, self.b
+        return (U/A)**(1/b)*xg**(-a/b)
+    def get_IC_from_point(self, x, y, xg):
+        U = self.eval_at(x, y)
+        return self.get_IC(U, xg)
+    def __repr__(self):
+        return self.print()
+
+class CES:
+    def __init__(self, a=0.5, rho=0.5):
+        self.a = a
+        self.rho = rho
+        self.bad = False
+        if self.a<=0.1 or self.a>=0.9:
+            self.bad = True
+        if self.rho>=0.8:
+            self.bad = True
+        if self.rho<-2:
+            self.bad = True
+        if np.abs(self.rho)<=0.1:
+            self.bad = True
+    def eval_at(self, x, y):
+        a, rho = self.a, self.rho
+        return (a*x**rho + (1-a)*y**rho)**(1/rho)
+    def get_IC(self, U, xg):
+        a, rho = self.a, self.rho
+        numerator = U**rho - a*xg**rho
+        ids = (numerator>0)
+        return xg[ids], (numerator[ids]/(1-a))**(1/rho)
+    def get_IC_from_point(self, x, y, xg):
+        U = self.eval_at(x,y)
+        return self.get_IC(U, xg)
+
+def get_cb_from_point(x, y, budget_constraint, x_='x', y_='y'):
+    px, py, I = budget_constraint.px, budget_constraint.py, budget_constraint.I
+    assert equals(x*px + y*py, I)
+    a = px*x/I
+    b = py*y/I
+    return CobbDouglas(A=1,a=a,b=b,x=x_,y=y_)
+
+def get_ces_from_points(x1,y1,x2,y2,bc1,bc2):
+    px1, py1, I1 = bc1.px, bc1.py, bc1.I
+    px2, py2, I2 = bc2.px, bc2.py, bc2.I
+    assert equals(px1*x1 + py1*y1, I1)
+    assert equals(px2*x2 + py2*y2, I2)
+    A1 = np.log((I1-px1*x1)/(py1*x1))
+    A2 = np.log((I2-px2*x2)/(py2*x2))
+    B1 = np.log(py1/px1)
+    B2 = np.log(py2/px2)
+    try:
+        M = np.array([
+            [A1, 1],
+            [A2, 1]
+        ])
+        Y = np.array([B1, B2])
+        X = np.linalg.solve(M,Y)
+    except:
+        return CES(rho=2,a=0)
+    rho = X[0]+1
+    a = 1/(1+np.exp(X[1]))
+    if equals(rho, 0):
+        return CobbDouglas(A=1, a=a, b=1-a)
+    else:
+        return CES(rho=rho, a=a)
+
+def simplifyCB(cbtop, cbbot):
+    assert cbtop.a!=0
+    assert cbtop.b!=0
+    assert equals( np.abs(cbtop.a)+np.abs(cbbot.a), 1)
+    assert equals( np.abs(cbtop.b)+np.abs(cbbot.b), 1)
+    assert sign(cbtop.a)!=sign(cbtop.b)
+    assert cbtop.x==cbbot.x
+    assert cbtop.y==cbbot.y
+    assert is_rational(cbtop.A/cbbot.A, maxdenom=cbbot.A)
+    x = cbtop.x
+    y = cbtop.y
+    a = cbtop.a
+    f = rational(cbtop.A/cbbot.A)
+    n = f.numerator
+    d = f.denominator
+    if a>0:
+        return fr"\(\frac{{{PTerm(n,x,1).print()}}}{{{PTerm(d,y,1).print()}}}\)"
+    else:
+        return fr"\(\frac{{{PTerm(n,y,1).print()}}}{{{PTerm(d,x,1).print()}}}\)"
+
+###################################################################
+# LINES
+###################################################################
+class Line:
+    # y = mx + b
+    # x = (y-b)/m
+    def __init__(self, m, b, linewidth=1, color='black', label='_nolegend_', linestyle='solid'):
+        self.m, self.b = m, b
+        self.linewidth = linewidth
+        self.color = color
+        self.label = label
+        self.linestyle = linestyle
+    def plot(self, ax, xg):
+        return ax.plot(xg, self.m*xg + self.b, color=self.color, linewidth=self.linewidth, label=self.label, linestyle=self.linestyle)
+    def eval_at_x(self, x):
+        return self.m*x + self.b
+    def eval_at_y(self, y):
+        return (y-self.b)/self.m
+
+class BudgetConstraint:
+    def __init__(self, px, py, I, linewidth=2, color='black', alpha=1.0, label='_nolegend_'):
+        self.px, self.py, self.I = px, py, I
+        self.xint = I/px
+        self.yint = I/py
+        self.linewidth = linewidth
+        self.color = color
+        self.alpha = alpha
+        self.label = label
+    def plot(self, ax, xg):
+        m = -self.px / self.py
+        b = self.I / self.py
+        ax.plot(xg, m*xg+b, color=self.color, linewidth=self.linewidth, alpha=self.alpha, label=self.label)
+        return ax
+
+###################################################################
+# ECONOMIC MODELS
+###################################################################
+
+class LinearDemand:
+    # p = a - bq
+    # q = (a/b) - (1/b)*p
+    def __init__(self, a=12, b=1,color='black',linewidth=1,label='_nolegend_',linestyle='solid'):
+        assert a>0
+        assert b>0
+        self.a = a
+        self.b = b
+        self.line = Line(-b,a,linewidth=linewidth,color=color,label=label,linestyle=linestyle)
+    def print(self, x='p', maxdenom=8):
+        return PolyEq(c=[self.a/self.b, -1/self.b], x=x, p=[0,1]).print(maxdenom=maxdenom, rmplus=True)
+    def print_inverse(self, x='q', maxdenom=8):
+        return PolyEq(c=[self.a, -self.b], x=x, p=[0,1]).print(maxdenom=maxdenom, rmplus=True)
+    def eval_at_p(self, p):
+        return self.a/self.b - (1/self.b)*p
+    def eval_at_q(self, q):
+        return self.a - self.b*q
+    def plot(self,ax, xg):
+        return self.line.plot(ax,xg)
+        
+class ExponentialDemand:
+    # p = a*q^k
+    # q = (1/a)^(1/k) p^(1/k)
+    def __init__(self, a=1, k=-1):
+        assert a>0
+        assert k<0
+        self.a = a
+        self.k = k
+    def print(self, x='p', maxdenom=36):
+        c = (1/self.a)**(1/self.k)
+        p = 1/self.k
+        return PTerm(c=c,x=x,p=p).print(rmplus=True,maxdenom=maxdenom)
+    def print_inverse(self, x='q', maxdenom=36):
+        c = self.a
+        p = self.k
+        return PTerm(c=c,x=x,p=p).print(rmplus=True,maxdenom=maxdenom)
+    def eval_at_p(self, p):
+        return (1/self.a)**(1/self.k) * p**(1/self.k)
+    def eval_at_q(self, q):
+        return self.a * q**self.k
+    
+class LinearSupply:
+    # p = a + bq
+    # q = (1/b)*p - (a/b)
+    def __init__(self, a=0, b=1,linewidth=1,color='black',label='_nolegend_',linestyle='solid'):
+        assert a>=0
+        assert b>=0
+        self.a = a
+        self.b = b
+        self.line = Line(b,a,linewidth=linewidth,color=color,label=label,linestyle=linestyle)
+    def print(self, x='p', maxdenom=8):
+        return PolyEq(c=[1/self.b, -self.a/self.b], x=x, p=[1,0]).print(maxdenom=maxdenom, rmplus=True)
+    def print_inverse(self, x='q', maxdenom=5):
+        return PolyEq(c=[self.a, self.b], x=x, p=[0,1]).print(maxdenom=maxdenom, rmplus=True)
+    def eval_at_p(self, p):
+        return (1/self.b)*p - (self.a/self.b)
+    def eval_at_q(self, q):
+        return self.a + self.b*q
+    def plot(self,ax, xg):
+        return self.line.plot(ax,xg)
+        
+class ExponentialSupply:
+    # p = aq^k
+    # q = (1/a)^(1/k) p^(1/k)
+    def __init__(self, a=1, k=1):
+        assert a>0
+        assert k>0
+        self.a = a
+        self.k = k
+    def print(self, x='p', maxdenom=36):
+        c = (1/self.a)**(1/self.k)
+        p = 1/self.k
+        return PTerm(c=c,x=x,p=p).print(rmplus=True,maxdenom=maxdenom)
+    def print_inverse(self, x='q', maxdenom=36):
+        c = self.a
+        p = self.k
+        return PTerm(c=c,x=x,p=p).print(rmplus=True,maxdenom=maxdenom)
+    def eval_at_p(self, p):
+        return (1/self.a)**(1/self.k) * p**(1/self.k)
+    def eval_at_q(self, q):
+        return self.a * q**self.k
+
+class LinearMarket:
+    # p = ad - bd*q
+    # p = as + bs*q
+    # q = (ad-as)/(bd+bs)
+    def __init__(self, demand=LinearDemand(), supply=LinearSupply()):
+        self.demand = demand
+        self.supply = supply
+        q = (demand.a - supply.a)/(demand.b + supply.b)
+        p1 = demand.a - demand.b*q
+        p2 = supply.a + supply.b*q
+        assert equals(p1,p2)
+        p = p1
+        CS = 0.5*(demand.a - p)*q
+        PS = 0.5*(p - supply.a)*q
+        self.eq = {'q':q, 'p':p, 'CS': CS, 'PS': PS, 'TS':CS+PS}
+
+class ExponentialMarket:
+    # p = ad * q^ kd
+    # p = as * q^ ks
+    # q = (ad/as)^(1/(ks - kd))
+    def __init__(self, demand=ExponentialDemand(), supply=ExponentialSupply()):
+        self.demand = demand
+        self.supply = supply
+        q = (demand.a / supply.a)**(1/(supply.k - demand.k))
+        assert q>0
+        p1 = demand.a * q**demand.k
+        p2 = supply.a * q**supply.k
+        assert equals(p1,p2)
+        p = p1
+        assert p>0
+        self.eq = {'q':q, 'p':p}
+
+class LinearConsumer:
+    # u(q) = aq - 0.5bq^2 - pq
+    # inv.demand: p = a - bq
+    def __init__(self, a=12, b=1):
+        demand = LinearDemand(a=a,b=b)
+        self.a, self.b = a, b
+        self.demand = demand
+    def print_utility(self, q='q'):
+        a, b = self.a, self.b
+        return fr"{PolyEq([a,-0.5*b],q,[1,2])} - p{q}"
+    def setup(self):
+        return fr"""
+A representative, price-taking consumer decides how many units, \(q\), of a commodity to purchase at unit price \(p\). The utility
+they receive for purchasing \(q\) units at price \(p\) is:
+$$ u(q) = {self.print_utility()} $$
+"""
+    def utility_at(self, p,q):
+        a, b = self.a, self.b
+        return a*q - 0.5*b*q**2 - p*q
+
+class LogConsumer:
+    # u(q) = a ln(q) - pq
+    # inv.demand: p = a - bq
+    def __init__(self, a=1):
+        demand = ExponentialDemand(a=a,k=-1)
+        self.a = a
+        self.demand = demand
+    def print_utility(self, q='q'):
+        a = self.a
+        lnq = PTerm(a,fr'\ln {q}',1)
+        return fr"{lnq} - p{q}"
+    def setup(self):
+        return fr"""
+A representative, price-taking consumer decides how many units, \(q\), of a commodity to purchase at unit price \(p\). The utility
+they receive for purchasing \(q\) units at price \(p\) is:
+$$ u(q) = {self.print_utility()} $$
+"""
+    def utility_at(self, p,q):
+        a = self.a
+        return a*np.log(q) - p*q
+
+class QuadraticCostFirm:
+    # c(q) = aq + 0.5*bq^2
+    # inv.supply: p = a + bq
+    def __init__(self, a=0, b=1):
+        assert a>0 or b>0
+        supply = LinearSupply(a=a,b=b)
+        self.a, self.b = a, b
+        self.supply = supply
+    def print_cost_function(self, q='q'):
+        a, b = self.a, self.b
+        return fr"{PolyEq([a,0.5*b],q,[1,2])}"
+    def setup(self):
+        return fr"""
+A representative, price-taking firm decides how many units, \(q\), of a commodity to produce and sell at unit price \(p\). The
+firm's total cost function for producing \(q\) units is:
+$$ c(q) = {self.print_cost_function()} $$
+"""
+    def profit_at(self,p,q):
+        a, b = self.a, self.b
+        return p*q - a*q - 0.5*b*q**2
+
+class Worker:
+    # u(L) = wL - d*L^k
+    def __init__(self, d=0.5, k=2):
+        self.d, self.k = d, k
+        supply = ExponentialSupply(a=k*d, k=k-1)
+        self.supply = supply
+    def print_objective(self, w='w', L='L'):
+        d, k = self.d, self.k
+        wL = f'{w}{L}'
+        return fr"{PolyEq([1,-d],[wL,L],[1,k])}"
+    def setup(self):
+        return fr"""
+A representative, price-taking worker decides how many units, \(L\), of labor to supply (e.g. how many hours to work), at a unit wage \(w\).
+The worker's utility function over working \(L\) labor-units at wage \(w\) is:
+
+$$ u(L) = {self.print_objective()} $$
+"""
+    def utility_at(self, w, L):
+        d, k = self.d, self.k
+        return w*L - d*L**k
+
+class ExponentialProductionFirm:
+    # f(L) = AL^k 
+    # Pi = pAL^k - wL
+    # c(q) = (1/A)^(1/k) wq^(1/k)
+    # w = p*k*A*L^(k-1)
+    def __init__(self, A=1, k=1/2):
+        self.A, self.k = A, k
+    def print_production_func(self, L='L'):
+        A, k = self.A, self.k
+        return fr"{PolyEq([A],L,[k])}"
+    def setup(self):
+        return fr"""
+A representative, price-taking firm uses labor to produce and sell a commodity at unit price \(p\). The firm hires labor at a constant wage rate \(w\). If the firm employs \(L\) units of labor, it can produce \(f(L)\) units of commodity output, where:
+
+$$ f(L) = {self.print_production_func()} $$
+"""
+    def profit_at(self, p, w, L):
+        A, k = self.A, self.k
+        return p*A*L**k - w*L
+    def get_labor_demand(self, p):
+        A, k = self.A, self.k
+        return ExponentialDemand(p*k*A, k-1)
+    def get_commodity_supply(self, p):
+        A, k = self.A, self.k
+        assert equals(k,1/2)
+        b = 2*(1/A)**(1/k)
+        return QuadraticCostFirm(0,b).supply
+
+class GeneralEquilibrium:
+    # f(L) = A*L^kf
+    # u(L) = w*L - d*L^kw
+    # u(q) = a*ln(q) - p*q
+    # Commodity Demand: p = a*q^-1
+    # Labor Demand: w = p*A*kf*L^(kf-1)
+    # Labor Supply: w = d*kw*L^(kw-1)
+    # Equilibrium Labor: L = (a*kf/d*kw)^(1/kw)
+    # Equilibrium Wage: a*kf*L^-1
+    def __init__(self, consumer, firm, worker):
+        assert type(consumer)==LogConsumer
+        assert type(firm)==ExponentialProductionFirm
+        assert type(worker)==Worker
+        self.consumer = consumer
+        self.firm = firm
+        self.worker = worker
+        A = firm.A
+        kf = firm.k
+        d = worker.d
+        kw = worker.k
+        a = consumer.a
+        L = (a*kf/(d*kw))**(1/kw)
+        w = a*kf/L
+        q = A*L**kf
+        p = a/q
+        U_consumer = consumer.utility_at(p,q)
+        U_worker = worker.utility_at(w,L)
+        profit = firm.profit_at(p, w, L)
+        assert equals(consumer.demand.eval_at_p(p), q)
+        assert equals(worker.supply.eval_at_p(w), L)
+        assert equals(q, A*L**kf)
+        self.eq = {'L':L, 'w':w, 'p':p, 'q':q, 'U_consumer':U_consumer, 'U_worker':U_worker, 'profit':profit}
+
+class CobbDouglasConsumer:
+    # u(x,y) = x^a y^b
+    # px*x + py*y = I
+    def __init__(self, cobb_douglas, budget_constraint):
+        assert type(cobb_douglas)==CobbDouglas
+        assert type(budget_constraint)==BudgetConstraint
+        A, a, b = cobb_douglas.A, cobb_douglas.a, cobb_douglas.b 
+        px, py, I = budget_constraint.px, budget_constraint.py, budget_constraint.I
+        x = I/(px*(1+b/a))
+        y = I/(py*(1+a/b))
+        U = x**a * y**b
+        self.x = x
+        self.y = y
+        self.U = U
+
+class IncomeSupportBudget:
+    def __init__(self, bc, min_y, color='black'):
+        self.bc = bc
+        self.min_y = min_y
+        self.color = color
+    def plot(self, ax, xg):
+        m = - self.bc.px / self.bc.py
+        b = self.bc.I / self.bc.py
+        bc = m*xg + b
+        ax.plot(xg, np.maximum(bc, self.min_y), color=self.color, linewidth=self.bc.linewidth, alpha=self.bc.alpha, label=self.bc.label)
+        return ax
+
+class CobbDouglasFirm:
+    # f(L,K) = A*L^a K^(1-a)
+    def __init__(self, A, a, color='black', linewidth=2, label='_nolegend_', linestyle='solid', alpha=1.0):
+        self.cb = CobbDouglas(A=A, a=a, b=1-a, x='L', y='K')
+        self.color = color
+        self.linewidth = linewidth
+        self.label = label
+        self.linestyle = linestyle
+        self.alpha = alpha
+    def print(self, maxdenom=8, rmplus=True, rmneg=False):
+        return self.cb.print(maxdenom=maxdenom,rmplus=rmplus,rmneg=rmneg)
+    def eval_at(self, L, K):
+        return cb.eval_at(L, K)
+    def get_isoquant(self, Q, xg):
+        return self.cb.get_IC(Q, xg)
+    def get_isoquant_from_point(self, L, K, xg):
+        return self.cb.get_IC_from_point(L, K, xg)
+    def __repr__(self):
+        return self.print()
+    def unit_cost_K(self, w, r):
+        A, a = self.cb.A, self.cb.a
+        return (1/A)*(((1-a)/a)**a)*(w/r)**a
+    def unit_cost_L(self, w, r):
+        A, a = self.cb.A, self.cb.a
+        return (1/A)*((a/(1-a)))**(1-a)*(r/w)**(1-a)
+    def unit_cost(self, w, r):
+        K = self.unit_cost_K(w,r)
+        L = self.unit_cost_L(w,r)
+        return w*L + r*K
+    def get_unit_isoquant(self, xg):
+        return self.get_isoquant(1, xg)
+    def plot(self, ax, xg):  # draw unit isoquant
+        ic = self.get_unit_isoquant(xg[1:])
+        ax.plot(xg[1:], ic, color=self.color, linewidth=self.linewidth, label=self.label, linestyle=self.linestyle, alpha=self.alpha)
+        return ax
+
+def get_cb_firm_from_point(L, K, w, r):
+    a = w*L/(w*L + r*K)
+    b = 1-a
+    A = 1/(L**a*K**(1-a))
+    return CobbDouglasFirm(A=A, a=a)
+
+class NormalForm:
+    def __init__(self, players, strategies, payoffs, gametype):
+        assert len(players)==2
+        assert len(strategies)==2
+        assert len(strategies[0])==len(payoffs)
+        assert len(payoffs[0])==len(strategies[1])
+        _payoffs_ = payoffs
+        # Initialize payoffs and best responses
+        payoffs = {}
+        payoffs[players[0]] = {}
+        payoffs[players[1]] = {}
+        br = {}
+        br[players[0]] = {}
+        br[players[1]] = {}
+        for s in strategies[1]:
+            payoffs[players[0]][s] = {}
+            br[players[0]][s] = {}
+        for s in strategies[0]:
+            payoffs[players[1]][s] = {}
+            br[players[1]][s] = {}
+
+        # Populate payoffs
+        for i in range(len(_payoffs_)):
+            for j in range(len(_payoffs_[0])):
+                strategy_1 = strategies[0][i]
+                strategy_2 = strategies[1][j]
+                payoffs[players[0]][strategy_2][strategy_1] = _payoffs_[i][j][0]
+                payoffs[players[1]][strategy_1][strategy_2] = _payoffs_[i][j][1]
+
+        # Find best responses
+        for player, opp_strategies in payoffs.items():
+            for opp_strategy, my_strategies in opp_strategies.items():
+                my_payoffs = np.array([v for (k,v) in my_strategies.items()])
+                #print(my_payoffs)
+                #print(my_payoffs.shape)
+                my_br = []
+                my_br_ids = np.argwhere(my_payoffs==np.amax(my_payoffs)).flatten()
+                #print(type(my_br_ids))
+                #print(my_br_ids)
+                #print(type(list(my_strategies.keys())))
+                #print(list(my_strategies.keys()))
+                for br_id in my_br_ids:
+                    my_br.append(list(my_strategies.keys())[br_id] )
+                br[player][opp_strategy] = my_br
+
+        # Find Nash equilibria
+        ne = []
+        ne_payoffs = []
+        ne_distractors = []
+        for s1 in strategies[0]:
+            for s2 in strategies[1]:
+                if (s1 in br[players[0]][s2]) and (s2 in br[players[1]][s1]):
+                    ne.append(fr"({s1},{s2})")
+                    ne_payoffs.append((payoffs[players[0]][s1][s2], payoffs[players[1]][s1][s2]))
+                else:
+                    ne_distractors.append(fr"({s1},{s2})")
+        
+        self.players = players
+        self.strategies = strategies
+        self._payoffs_ = _payoffs_
+        self.payoffs = payoffs
+        self.br = br
+        self.ne = ne
+        self.ne_payoffs = ne_payoffs
+        self.ne_distractors = ne_distractors
+        self.gametype = gametype
+    
+    def table_as_html(self, circle_br=False):
+        t = '<table border=1px align="center">'
+        N = len(self.strategies[0])
+        K = len(self.strategies[1])
+        players = self.players
+        strategies = self.strategies
+        payoffs = self._payoffs_
+        br = self.br
+        t+=  '<tr>'
+        t+=  '<td></td>'
+        t+=  '<td></td>'
+        t+= f'<td colspan={K} align="center">{players[1]}</td>'
+        t+=  '</tr>'
+        t+=  '<tr>'
+        t+=  '<td></td>'
+        t+=  '<td></td>'
+        for k in range(K):
+            t+= f'<td align="center">{strategies[1][k]}</td>'
+        t+= '</tr>'
+        for i in range(N):
+            t+= '<tr>'
+            if i==0:
+                t+= f'<td rowspan={N}>{players[0]}</td>'
+            t+= f'<td>{strategies[0][i]}</td>'
+            for k in range(K):
+                if circle_br and (strategies[0][i] in br[players[0]][strategies[1][k]]):
+                    u1 = f'<span style="border-width:2px; border-style:solid; border-color:#FF0000;">{payoffs[i][k][0]}</span>'
+                else:
+                    u1 = f'{payoffs[i][k][0]}'
+                if circle_br and (strategies[1][k] in br[players[1]][strategies[0][i]]):
+                    u2 = f'<span style="border-width:2px; border-style:solid; border-color:#FF0000;">{payoffs[i][k][1]}</span>'
+                else:
+                    u2 = f'{payoffs[i][k][1]}'
+                t+= f'<td align="center">{u1}, {u2}</td>'
+            t+=  '</tr>'
+        t+=  '</table>'
+        return t
+
+    def table_as_latex(self):
+        players = self.players
+        strategies = self.strategies
+        payoffs = self._payoffs_
+        N = len(strategies[0])
+        K = len(strategies[1])
+        t = fr"""
+\begin{{center}}
+\begin{{tabular}}{{|c|c|{'c|'*K}}} \hline
+ & & \multicolumn{{{K}}}{{c|}}{{ {players[1]} }} \\ \hline
+"""
+        t+= " & "
+        for k in range(K):
+            t+= fr" & {strategies[1][k]}"
+        t+= fr"\\ \hline" + '\n'
+        for i in range(N):
+            if i==0:
+                t+= fr"\multirow{{{N}}}{{*}}{{{players[0]}}} "
+            t+= fr" & {strategies[0][i]} "
+            for k in range(K):
+                t+= fr" & {payoffs[i][k][0]}, {payoffs[i][k][1]} "
+            if i==N-1:
+                t+= fr"\\ \hline" + '\n'
+            else:
+                t+= fr"\\ \cline{{2-{K+2}}}" + '\n'
+        t+=fr"""
+\end{{tabular}}
+\end{{center}}
+"""
+        return t
+
+class Monopoly:
+    # c(q) = f + aq + b*q^2
+    # demand is of class LinearDemand
+    def __init__(self, demand, f=0, a=0, b=0.5):
+        q = (demand.a - a)/(2*(demand.b + b))
+        p = demand.a - demand.b*q
+        profit = p*q - f - a*q - b*q**2
+        CS = 0.5*(demand.a - p)*q
+        q_eff = (demand.a - a)/(demand.b + 2*b)
+        p_eff = demand.a - demand.b*q_eff
+        profit_eff = p_eff*q_eff - f - a*q_eff - b*q_eff**2
+        CS_eff = 0.5*(demand.a - p_eff)*q_eff
+        DWL = (CS_eff + profit_eff) - (CS + profit)
+        self.demand = demand
+        self.f = f
+        self.a = a
+        self.b = b
+        self.sol = {'q':q, 'p':p, 'CS':CS, 'profit':profit, 
+                    'q_eff': q_eff, 'p_eff': p_eff, 'CS_eff':CS_eff, 'profit_eff':profit_eff,
+                    'DWL':DWL}
+    def print_cost_function(self, q='q'):
+        f, a, b = self.f, self.a, self.b
+        return fr"{PolyEq([f,a,b],q,[0,1,2])}"
+    def setup(self):
+        return fr"""
+The market is supplied by a single monopolist, who can produce \(q\) units of the commodity at a total cost of:
+$$ c(q) = {self.print_cost_function()} $$
+"""
+
+class PriceDiscrimination:
+    # c(q) = cq
+    # demand1 and demand2 are of class LinearDemand
+    def __init__(self, demand1, demand2, c=1):
+        monopoly1 = Monopoly(demand1, f=0, a=c, b=0)
+        monopoly2 = Monopoly(demand2, f=0, a=c, b=0)
+        a1 = demand1.a
+        b1 = demand1.b
+        a2 = demand2.a
+        b2 = demand2.b
+        gamma = (a1/b1 + a2/b2)/(1/b1+1/b2)
+        delta = 1/(1/b1 + 1/b2)
+        demand_both = LinearDemand(a=gamma, b=delta)
+        monopoly_both = Monopoly(demand_both, f=0, a=c, b=0)
+        self.demand1 = demand1
+        self.demand2 = demand2
+        self.c = c
+        self.monopoly1 = monopoly1
+        self.monopoly2 = monopoly2
+        self.demand_both = demand_both
+        self.monopoly_both = monopoly_both
+    def setup(self):
+        return fr"""
+The market is supplied by a single monopolist, who can practice third degree price discrimination. The monopoly can produce \(q\) units of the commodity at a total cost of:
+$$ c(q) = {self.monopoly1.print_cost_function()} $$
+"""
+
+
+class Cournot2:
+    def __init__(self, firm1, firm2, demand):
+        a1 = firm1.a
+        b1 = firm1.b
+        a2 = firm2.a
+        b2 = firm2.b
+        alpha = demand.a
+        beta = demand.b
+        M = np.array([
+            [2*beta+b1,      beta],
+            [     beta, 2*beta+b2]
+        ])
+        y = np.array([alpha-a1, alpha-a2])
+        x = np.linalg.solve(M, y)
+        q1 = x[0]
+        q2 = x[1]
+        Q = q1 + q2
+        p = alpha - beta*Q
+        profit1 = firm1.profit_at(p, q1)
+        profit2 = firm2.profit_at(p, q2)
+        self.sol = {'p':p, 'q1':q1, 'q2':q2, 'Q':Q, 'profit1':profit1, 'profit2':profit2}
+        self.firm1 = firm1
+        self.firm2 = firm2
+        self.demand = demand
+    def setup(self):
+        return fr"""
+Price-taking consumers in the market for a commodity have a demand curve given by:
+$$ Q = {self.demand.print()} $$
+The market is supplied by two firms who produce identical products. Firm 1 has a cost function given by:
+$$ c_1(q_1) = {self.firm1.print_cost_function(q='q_1')} $$
+Firm 2 has a cost function given by:
+$$ c_2(q_2) = {self.firm2.print_cost_function(q='q_2')} $$
+The firms engage in Cournot competition, i.e. they choose the quantity they wish to produce and let the market determine the price.
+"""
+
+class CournotN:
+    def __init__(self, mc, N, demand):
+        alpha = demand.a
+        beta = demand.b
+        q = (alpha - mc)/((N+1)*beta)
+        Q = N*q
+        p = alpha - beta*Q
+        profit = p*q - mc*q
+        total_profit = N*profit
+        self.N = N
+        self.mc = mc
+        self.demand = demand
+        self.sol = {'q':q, 'Q':Q, 'p':p, 'profit':profit, 'total_profit':total_profit}
+    def setup(self):
+        return fr"""
+Price-taking consumers in the market for a commodity have a demand curve given by:
+$$ Q = {self.demand.print()} $$
+The market is supplied by \(N={self.N:g}\) identical firms. Each firm has a constant average and marginal cost of production equal to \(c={self.mc:g}\). The firms engage in Cournot competition, i.e. they choose the quantity they wish to produce and let the market determine the price.
+"""
+
+class Insurance:
+    def __init__(self, W0=1000, D=200, p=0.2, fun='ln'):
+        self.W0 = W0
+        self.D = D
+        self.p = p
+        self.fun = fun
+        if fun=='ln':
+            ufun = np.log
+            uinv = np.exp
+        elif fun=='sqrt':
+            ufun = np.sqrt
+            uinv = lambda x: x**2
+        EX = (1-p)*W0 + p*(W0 - D)
+        EU = (1-p)*ufun(W0) + p*ufun(W0 - D)
+        CE = uinv(EU)
+        WTP = W0 - CE
+        FairCost = p*D
+        self.sol = {'EX':EX, 'EU':EU, 'CE':CE, 'WTP':WTP, 'FairCost':FairCost}
+    def setup(self):
+        W0, D, p, fun = self.W0, self.D, self.p, self.fun
+        if fun=='ln':
+            funstr = fr"\ln X"
+        elif fun=='sqrt':
+            funstr = fr"\sqrt{{X}}"
+        return fr"""
+An individual has an initial wealth of \({W0:,g}\). There is a \({p*100:g}\%\) chance that the individual has an accident which would force them to pay \({D:,g}\) to fix the problem. Let \(X\) be a random variable representing the person's wealth at the end of the day. The individual's utility function over wealth is:
+$$ u(X) = {funstr} $$
+"""
+
+class Savings:
+    def __init__(self, Y, beta, p):
+        self.Y = Y
+        self.beta = beta
+        self.p = p
+        c2 = Y/(p*(1+1/beta))
+        c1 = Y - p*c2
+        r = (1-p)/p
+        self.sol = {'c1':c1, 'c2':c2, 'r':r}
+    def setup(self):
+        Y, beta, p = self.Y, self.beta, self.p
+        return fr"""
+An individual lives for two periods. In period 1, they earn an income of \(Y={Y:,g}\). In period 2, they earn no income. In order to consume in period 2, they must buy bonds in period 1. One bond pays \(\$1\) in period 2, and can be purchased for price \(p={p:g}\) in period 1. The individual's objective is to maximize the present value of their utility:
+$$\ln c_1 + \beta \ln c_2$$
+where \(c_1\) is consumption period 1, \(c_2\) is consumption in period 2, and \(\beta={beta:g}\) is the individual's subjective time discount factor.
+"""
+
+###################################################################
+# LIVE PROBLEMS
+# The online text of problems that need no graphs or sympy, so rpg.py
+# can build fresh ones from their params. live_problem(TYPE, params,
+# setup_id, question_ids) gives what get_online_format gives for the
+# same problem in utils2, and LIVE_PARAMS are the bank columns it reads.
+# The question tables are shared with the problem classes in utils2:
+# each entry is (question, key into the model's solution, symbol in the
+# answer), or None for a question that needs a graph.
+###################################################################
+
+LINEAR_MARKET_QUESTIONS = [
+    ("Calculate the equilibrium price.", 'p', 'p'),
+    ("Calculate the equilibrium quantity.", 'q', 'q'),
+    None,
+    ("Calculate the consumer surplus.", 'CS', 'CS'),
+    ("Calculate the producer surplus.", 'PS', 'PS'),
+]
+
+MONOPOLY_QUESTIONS = [
+    ("Calculate the profit maximizing price.", 'p', 'p'),
+    ("Calculate the profit maximizing quantity.", 'q', 'q'),
+    ("Calculate the monopolist's profit.", 'profit', r'\Pi'),
+    ("Calculate the consumer utility.", 'CS', 'U'),
+    ("What quantity would a benevolent social planner choose, in order to maximize total surplus?", 'q_eff', 'q_e'),
+    ("What price would a benevolent social planner choose? (Assume the planner chooses price quantity pairs on the demand curve.)", 'p_eff', 'p_e'),
+    ("Calculate the monopolist's profit under the benevolent social planner's choices.", 'profit_eff', r'\Pi_e'),
+    ("Calculate the consumer utility under the benevolent social planner's choices.", 'CS_eff', 'U_e'),
+    ("Calculate the deadweight loss caused by monopolistic behavior.", 'DWL', 'DWL'),
+]
+
+COURNOT2_QUESTIONS = [
+    ("What quantity does firm 1 produce in the Nash equilibrium?", 'q1', 'q_1'),
+    ("What quantity does firm 2 produce in the Nash equilibrium?", 'q2', 'q_2'),
+    ("What is the Nash equilibrium price in this market?", 'p', 'p'),
+    ("What is the Nash equilibrium profit of firm 1?", 'profit1', r'\Pi_1'),
+    ("What is the Nash equilibrium profit of firm 2?", 'profit2', r'\Pi_2'),
+]
+
+INSURANCE_QUESTIONS = [
+    (r"Calculate the expected value of \(X\).", 'EX', 'E[X]'),
+    (r"Calculate the expected utility.", 'EU', 'E[u(X)]'),
+    (r"Calculate the certainty equivalent of \(X\).", 'CE', 'CE'),
+    (r"How much is the person willing to pay to avoid the risk of the accident?", 'WTP', 'WTP'),
+    (r"How much would it cost a risk-neutral insurance company to insure the individual against this risk?", 'FairCost', 'C'),
+]
+
+def online_answer(symbol, answer):
+    return fr"\({symbol} = {answer:g}\)"
+
+def online_format(online_setup, questions):
+    # questions are (online_question, online_answer) pairs
+    setup = '<p>'+online_setup+'</p>\n' if len(online_setup)>0 else ''
+    solution = ''
+    for i, (question, answer) in enumerate(questions, 1):
+        setup+=f'<p>{i}. ' + question + '</p>\n'
+        solution+=f'<p>{i}. ' + answer + '</p>\n'
+    return {'setup': setup, 'solution': solution}
+
+def linear_market_setup(market, setup_id=0):
+    demand, supply = market.demand, market.supply
+    setup = fr"""
+Supply and demand in a market are defined by the following equations:
+\begin{{align*}}
+q_d &= {demand.print()} \\
+q_s &= {supply.print()} 
+\end{{align*}}
+"""
+    online_setup = fr"""
+Supply and demand in a market are defined by the following equations:
+$$\begin{{align}}
+q_d &= {demand.print()} \\
+q_s &= {supply.print()}
+\end{{align}}$$
+"""
+    return {"setup": setup, "online_setup": online_setup}
+
+def monopoly_setup(consumer, monopoly, setup_id=0):
+    # 0: the consumers' demand curve, 1: their utility function
+    if setup_id==0:
+        setup = fr"""
+Price-taking consumers in the market for a commodity have a demand curve given by:
+$$ q = {consumer.demand.print()} $$
+{monopoly.setup()}
+"""
+    else:
+        setup = fr"""
+{consumer.setup()}
+{monopoly.setup()}
+"""
+    return {"setup": setup, "online_setup": setup}
+
+def live_linear_market(params, setup_id):
+    market = LinearMarket(LinearDemand(a=params['ad'], b=params['bd']), LinearSupply(a=params['as'], b=params['bs']))
+    return linear_market_setup(market, setup_id), market.eq, LINEAR_MARKET_QUESTIONS
+
+def live_monopoly(params, setup_id):
+    consumer = LinearConsumer(params['alpha'], params['beta'])
+    monopoly = Monopoly(consumer.demand, params['f'], params['a'], params['b'])
+    return monopoly_setup(consumer, monopoly, setup_id), monopoly.sol, MONOPOLY_QUESTIONS
+
+def live_cournot2(params, setup_id):
+    firm1 = QuadraticCostFirm(a=params['a1'], b=params['b1'])
+    firm2 = QuadraticCostFirm(a=params['a2'], b=params['b2'])
+    cournot2 = Cournot2(firm1, firm2, LinearDemand(a=params['alpha'], b=params['beta']))
+    setup = cournot2.setup()
+    return {"setup": setup, "online_setup": setup}, cournot2.sol, COURNOT2_QUESTIONS
+
+def live_insurance(params, setup_id):
+    insurance = Insurance(W0=params['W0'], D=params['D'], p=params['p'], fun=params['fun'])
+    setup = insurance.setup()
+    return {"setup": setup, "online_setup": setup}, insurance.sol, INSURANCE_QUESTIONS
+
+LIVE = {
+    'LinearMarketProblem': live_linear_market,
+    'MonopolyProblem': live_monopoly,
+    'Cournot2Problem': live_cournot2,
+    'InsuranceProblem': live_insurance,
+}
+
+LIVE_PARAMS = {
+    'LinearMarketProblem': ['ad', 'bd', 'as', 'bs'],
+    'MonopolyProblem': ['alpha', 'beta', 'f', 'a', 'b'],
+    'Cournot2Problem': ['alpha', 'beta', 'a1', 'b1', 'a2', 'b2'],
+    'InsuranceProblem': ['W0', 'D', 'p', 'fun'],
+}
+
+def live_problem(problem_str, params, setup_id=0, question_ids=None):
+    # the get_online_format payload of a problem built from params
+    setup, sol, questions = LIVE[problem_str](params, setup_id)
+    if question_ids is None:
+        question_ids = [i for i, q in enumerate(questions) if q is not None]
+    if any(questions[i] is None for i in question_ids):
+        raise ValueError(f"{problem_str} questions {question_ids} include one that needs a graph")
+    return online_format(setup['online_setup'], [(questions[i][0], online_answer(questions[i][2], sol[questions[i][1]])) for i in question_ids])
@@ -0,0 +1,138 @@
+from fractions import Fraction
+from functools import lru_cache
+import math
+
+import numpy as np
+
+###################################################################
+# RATIONAL APPROXIMATION
+# Replaces sympy.nsimplify for the printing and grid checks in utils2.
+# nsimplify hands a float to mpmath.identify, which looks for integer
+# relations (coefficients <= 1000) satisfied by x, 1/x, x^2, 1/x^2,
+# sqrt(x) or 1/sqrt(x) to within 1e-15, then for a product of powers
+# of 2, 3, 5 and 7. If nothing is found it reads off 15 significant
+# digits as a decimal fraction. rational() runs the same checks with
+# exact Fraction arithmetic on the one candidate that can pass them,
+# the best approximation to x with denominator <= 1000. The powers of
+# 2, 3, 5 and 7 may be fractional, and with coefficients up to 1000 PSLQ
+# finds such a product for some plain decimals (727.5, 857.375, ...), so
+# for values the cheap checks don't identify that search is run as
+# nsimplify runs it, with mpmath, and a fractional product makes the
+# value irrational.
+###################################################################
+
+MAXCOEFF = 1000
+TOL = 1e-15
+SMOOTH_PRIMES = (2, 3, 5, 7)
+
+def is_smooth(n):
+    n = abs(n)
+    if n==0: return False
+    for prime in SMOOTH_PRIMES:
+        while n % prime == 0:
+            n //= prime
+    return n==1
+
+def norm(*v):
+    return math.sqrt(sum(float(a)**2 for a in v))
+
+def has_relation(t, a, b):
+    # b*t - a = 0 as found by pslq on [t, 1], or by pslq on [1, t, t^2]
+    # as t*(b*t - a), (b*t - a)^2 or (b*t - a)*(c*t - d)
+    if a>MAXCOEFF or b>MAXCOEFF: return False
+    tf = float(t)
+    if tf>MAXCOEFF**2 or tf<TOL: return False
+    r = float(abs(t*b - a))
+    tol = TOL*norm(1, t, t*t)
+    if r < TOL*norm(t, 1): return True
+    if tf*r < tol: return True
+    if max(a*a, b*b, 2*a*b)<=MAXCOEFF and r*r < tol: return True
+    # any other root d/c is about 1/(b*c) away from a/b
+    if r >= 2*b*tol: return False
+    for c in range(1, MAXCOEFF//b + 1):
+        d0 = round(tf*c)
+        for d in (d0-1, d0, d0+1):
+            if d<=0 or d*b==a*c: continue
+            if a*d>MAXCOEFF or a*c+b*d>MAXCOEFF: continue
+            if r*abs(tf*c - d) < tol: return True
+    return False
+
+def is_identified(x, f):
+    p, q = abs(f.numerator), f.denominator
+    if p==0: return False
+    x = abs(Fraction(x))
+    candidates = [(x, p, q), (1/x, q, p), (x*x, p*p, q*q), (1/(x*x), q*q, p*p)]
+    sp, sq = math.isqrt(p), math.isqrt(q)
+    if sp*sp==p and sq*sq==q:
+        s = Fraction(math.sqrt(x))
+        candidates += [(s, sp, sq), (1/s, sq, sp)]
+    for t, a, b in candidates:
+        if has_relation(t, a, b): return True
+    if is_smooth(p) and is_smooth(q):
+        logs = [math.log(x)] + [math.log(prime) for prime in SMOOTH_PRIMES]
+        if abs(math.log(x) - math.log(p/q)) < TOL*norm(*logs): return True
+    return False
+
+def has_power_product(x):
+    # mpmath.identify's last search, at nsimplify's 30 digits: an integer
+    # relation between ln|x| and ln 2, ln 3, ln 5, ln 7 with coefficients
+    # <= 1000. True if one is found whose exponents aren't all integers.
+    import mpmath
+    with mpmath.workdps(30):
+        xv = abs(mpmath.mpf(x))
+        if xv==1: return False
+        logs = [mpmath.ln(xv)] + [mpmath.ln(prime) for prime in SMOOTH_PRIMES]
+        r = mpmath.pslq(logs, TOL, MAXCOEFF)
+    if r is None or max(abs(c) for c in r)>MAXCOEFF or not r[0]: return False
+    return any(c % r[0] for c in r[1:])
+
+def decimal_fraction(x):
+    # nsimplify scales x by a power of 10 before taking 15 digits, and
+    # the scaling rounds too, so the last digit can differ from f'{x:.15g}'
+    k = int(math.log(abs(x))/math.log(10))
+    d = Fraction(10)**k
+    return Fraction(f'{x/float(d):.15g}')*d
+
+@lru_cache(maxsize=2**16)
+def _rational(x):
+    if x==0: return Fraction(0)
+    f = Fraction(x).limit_denominator(MAXCOEFF)
+    if is_identified(x, f): return f
+    if has_power_product(x): return None
+    return decimal_fraction(x)
+
+def rational(x):
+    # Fraction approximating x, or None if x is not a finite real number
+    # or nsimplify would take it for an irrational one
+    try:
+        x = float(x)
+    except (TypeError, ValueError):
+        return None
+    if not np.isfinite(x): return None
+    return _rational(x)
+
+def is_rational(x, maxdenom=8):
+    f = rational(x)
+    if f is None: return False
+    return f.denominator <= maxdenom
+
+def is_rational_array(x, maxdenom=8):
+    # Vectorized is_rational. Values that rational() maps to n/d are well
+    # within a relative 1e-6 of n/d, so that screen is done for all
+    # d <= maxdenom at once and only the values that pass it are checked.
+    x = np.asarray(x, dtype=float)
+    shape = x.shape
+    x = x.ravel()
+    d = np.arange(1, maxdenom+1)
+    with np.errstate(invalid='ignore', over='ignore'):
+        n = np.rint(x[:,None]*d)
+        close = np.abs(x[:,None] - n/d) <= 1e-6*np.abs(x[:,None])
+    out = np.zeros(x.shape, dtype=bool)
+    for i in np.flatnonzero(close.any(axis=1) & np.isfinite(x)):
+        out[i] = is_rational(x[i], maxdenom)
+    return out.reshape(shape)
+
+def is_divisible(p, q):
+    f = rational(p/q)
+    if f is None: return False
+    return f.denominator==1
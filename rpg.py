@@ -1,33 +1,308 @@
-import os
 import json
-import numpy as np
-from js import MathJax
-from pyscript import window, document, when
-
-@when("click", "#button")
-def generate_problem():
-    
-    lec = document.getElementById("dropdown").value
-    filename = f"{lec}-practice.json"
-    
-    if os.path.exists(filename):
-        with open(filename, 'r') as f:
-            probs = json.load(f)
-        myprob = np.random.choice(probs)
-        setup = myprob['setup']
-        solution = myprob['solution']
-        element = document.getElementById("problem")
-        element.innerHTML = setup
-        element = document.getElementById("solution")
-        element.innerHTML = solution
-    else:
-        element = document.getElementById("problem")
-        element.innerHTML = "Sorry, there aren't any practice problems for this week yet!"
-        element = document.getElementById("solution")
-        element.innerHTML = ""
-    
-    element = document.getElementById("details")
-    element.removeAttribute('open')
-    
-    MathJax.typesetPromise()
+import gzip
+import zlib
+import random
+import asyncio
+import js
+from pyodide.ffi import to_js, create_proxy
+from pyodide.http import pyfetch
+from polyscript import xworker
 
+# Runs in a web worker started by assets/js/rpg.js, which owns the page.
+# The page asks for problems with {'id', 'type', 'lec'} messages and
+# gets back {'id', ...} replies; this side never touches the DOM.
+
+DATA_URL = "/CSUN-Econ-310/assets/data"
+
+def post(msg):
+    xworker.postMessage(to_js(msg, dict_converter=js.Object.fromEntries))
+
+def profile(label):
+    # startup profile, logged to the console as milliseconds since the
+    # worker started (the page marks rpg:start and rpg:ready itself)
+    js.performance.mark(label)
+    js.console.log(f"rpg {label}: {js.performance.now():.0f} ms")
+
+profile("rpg:worker")
+
+# the lectures in the page's dropdown, in order, and the shuffle bags the
+# page had saved to localStorage, both sent over in the 'init' message
+LECTURES = []
+STORE = {}
+
+# core.py and rationals.py, from assets/py, are put next to this file by
+# rpg.toml's [files], but numpy and core are only loaded the first time a
+# lecture with live problems is selected, so other lectures never wait on them
+CORE = None
+
+async def import_core():
+    import pyodide_js
+    start = js.performance.now()
+    await pyodide_js.loadPackage(to_js(['numpy', 'mpmath']))
+    import core
+    js.console.log(f"rpg core import: {js.performance.now() - start:.0f} ms")
+    profile("rpg:core")
+    return core
+
+async def load_core():
+    global CORE
+    if CORE is None:
+        CORE = asyncio.ensure_future(import_core())
+    try:
+        return await CORE
+    except Exception:
+        CORE = None
+        raise
+
+# files whose server ignored a Range request and sent them whole
+WHOLE = {}
+
+async def fetch_range(url, start, end, size):
+    # bytes start to end-1 of url, which is size bytes long
+    if url not in WHOLE:
+        response = await pyfetch(url, headers={'Range': f"bytes={start}-{end-1}"})
+        data = await response.bytes()
+        if response.status==206 and len(data)==end-start:
+            return data
+        if not (response.ok and len(data)==size):
+            raise ValueError(f"bad range response for {url}")
+        WHOLE[url] = data
+    return WHOLE[url][start:end]
+
+class Bank:
+    # One lecture's practice problems. With the bank's index, problems are
+    # fetched one at a time by Range request (see _workspace/practice.py):
+    # deflated against the bank's dictionary if it has one, else from the
+    # plain .jsonl, and the whole .json is downloaded once only if
+    # neither works, or without the index. The bank's files leave out
+    # their svg defs, which come once from its .defs.svg.gz. Places past
+    # the prebuilt problems are the index's "live" ones, built here from
+    # the bank's .live.json.gz specs with core.live_problem.
+    def __init__(self, lec, index=None, probs=None):
+        self.lec = lec
+        self.index = index
+        self.probs = probs
+        self.zdict = None
+        self.defs = None
+        self.defs_sent = False
+        self.live = None
+        self.n = index['n'] + index.get('live', 0) if index else len(probs)
+    async def get(self, i):
+        if self.index and i>=self.index['n']:
+            return await self.get_live(i - self.index['n'])
+        prob = None
+        if self.probs is None:
+            try:
+                prob = json.loads(await self.get_line(i))
+            except Exception:
+                self.probs = await fetch_json(f"{DATA_URL}/{self.lec}-practice.json")
+        if prob is None:
+            prob = self.probs[i]
+        if self.index and self.index.get('defs'):
+            if self.defs is None:
+                self.defs = asyncio.ensure_future(self.fetch_defs())
+            try:
+                await self.defs
+            except Exception:
+                # tried again with the next problem
+                self.defs = None
+                raise
+        return prob
+    async def get_line(self, i):
+        if 'zlib' in self.index:
+            try:
+                return await self.get_deflated(i)
+            except Exception:
+                # the plain .jsonl from now on
+                self.index.pop('zlib', None)
+        offsets = self.index['offsets']
+        return await fetch_range(f"{DATA_URL}/{self.lec}-practice.jsonl",
+                                 offsets[i], offsets[i+1], self.index['size'])
+    async def fetch_zdict(self):
+        response = await pyfetch(f"{DATA_URL}/{self.lec}-practice.zdict.gz")
+        if not response.ok:
+            raise ValueError(f"no dictionary for {self.lec}")
+        return gzip.decompress(await response.bytes())
+    async def fetch_defs(self):
+        response = await pyfetch(f"{DATA_URL}/{self.lec}-practice.defs.svg.gz")
+        if not response.ok:
+            raise ValueError(f"no svg defs for {self.lec}")
+        return gzip.decompress(await response.bytes()).decode()
+    async def fetch_live(self):
+        response = await pyfetch(f"{DATA_URL}/{self.lec}-practice.live.json.gz")
+        if not response.ok:
+            raise ValueError(f"no live specs for {self.lec}")
+        return json.loads(gzip.decompress(await response.bytes()))
+    async def get_live(self, i):
+        # a fresh problem for live place i, from a random row of its spec's params
+        if self.live is None:
+            self.live = asyncio.ensure_future(self.fetch_live())
+        try:
+            specs = await self.live
+        except Exception:
+            self.live = None
+            raise
+        core = await load_core()
+        for spec in specs:
+            if i<spec['n']:
+                break
+            i -= spec['n']
+        params = spec['params']
+        j = random.randrange(len(next(iter(params.values()))))
+        prob = core.live_problem(spec['type'], {name: values[j] for name, values in params.items()},
+                                 spec['setup_id'], spec['question_ids'])
+        return {**prob, 'typeset': False}
+    def take_defs(self):
+        # the svg defs for the page to add, the first time a problem needs them
+        if self.defs is None or self.defs_sent:
+            return ''
+        self.defs_sent = True
+        return self.defs.result()
+    async def get_deflated(self, i):
+        if self.zdict is None:
+            self.zdict = asyncio.ensure_future(self.fetch_zdict())
+        zdict = await self.zdict
+        z = self.index['zlib']
+        data = await fetch_range(f"{DATA_URL}/{self.lec}-practice.jsonl.z",
+                                 z['offsets'][i], z['offsets'][i+1], z['size'])
+        return zlib.decompressobj(zdict=zdict).decompress(data)
+
+async def fetch_json(url):
+    response = await pyfetch(url)
+    return await response.json() if response.ok else None
+
+# practice banks, one per lecture, fetched the first time the lecture
+# is selected; None if the lecture has no bank
+BANKS = {}
+PENDING = {}
+
+async def fetch_bank(lec):
+    try:
+        index = await fetch_json(f"{DATA_URL}/{lec}-practice.index.json")
+        if index:
+            BANKS[lec] = Bank(lec, index=index)
+        else:
+            probs = await fetch_json(f"{DATA_URL}/{lec}-practice.json")
+            BANKS[lec] = Bank(lec, probs=probs) if probs else None
+        profile(f"rpg:bank:{lec}")
+    except Exception:
+        BANKS[lec] = None
+    finally:
+        PENDING.pop(lec, None)
+    return BANKS[lec]
+
+def load_bank(lec):
+    # starts fetching lec in the background, unless it is loaded or on its way
+    if lec not in BANKS and lec not in PENDING:
+        PENDING[lec] = asyncio.ensure_future(fetch_bank(lec))
+    return PENDING.get(lec)
+
+async def get_bank(lec):
+    if lec in BANKS:
+        return BANKS[lec]
+    return await load_bank(lec)
+
+def prefetch_neighbours(lec):
+    if lec not in LECTURES:
+        return
+    i = LECTURES.index(lec)
+    for j in [i+1, i-1]:
+        if 0<=j<len(LECTURES):
+            load_bank(LECTURES[j])
+
+class ShuffleBag:
+    # Deals every problem in a bank once, in random order, before any
+    # repeats. The bag is a seeded permutation, so only the seed and the
+    # position are saved to localStorage, and a reload picks up where it
+    # left off. A new bag never starts with the problem that ended the last one.
+    # Workers have no localStorage, so the page does the saving.
+    def __init__(self, lec, n):
+        self.key = f"rpg-bag-{lec}"
+        self.n = n
+        state = self.load()
+        if state is None:
+            state = self.new_state(avoid=None)
+        self.state = state
+        self.order = self.get_order()
+    def load(self):
+        try:
+            state = json.loads(STORE[self.key])
+            assert state['n']==self.n and 0<=state['pos']<=self.n
+            return state
+        except Exception:
+            return None
+    def save(self):
+        STORE[self.key] = json.dumps(self.state)
+        post({'type': 'store', 'key': self.key, 'value': STORE[self.key]})
+    def new_state(self, avoid):
+        seed = random.randrange(2**31-1)
+        return {'n': self.n, 'seed': seed, 'pos': 0, 'avoid': avoid}
+    def get_order(self):
+        order = list(range(self.n))
+        random.Random(self.state['seed']).shuffle(order)
+        if self.n>1 and order[0]==self.state['avoid']:
+            order[0], order[-1] = order[-1], order[0]
+        return order
+    def next(self):
+        if self.state['pos']>=self.n:
+            self.state = self.new_state(avoid=self.order[-1])
+            self.order = self.get_order()
+        i = self.order[self.state['pos']]
+        self.state['pos'] += 1
+        self.save()
+        return i
+
+BAGS = {}
+
+def get_bag(lec, n):
+    if lec not in BAGS:
+        BAGS[lec] = ShuffleBag(lec, n)
+    return BAGS[lec]
+
+async def select_lecture(lec):
+    bank = await get_bank(lec)
+    if bank and bank.index and bank.index.get('live'):
+        asyncio.ensure_future(load_core())
+    prefetch_neighbours(lec)
+    return {'n': bank.n if bank else 0}
+
+async def deal_problem(lec):
+    # the next problem from lec's bag, or None if lec has no problems
+    bank = await get_bank(lec)
+    if not bank or not bank.n:
+        return {'problem': None}
+    myprob = await bank.get(get_bag(lec, bank.n).next())
+    return {'problem': {
+        'setup': myprob['setup'],
+        'solution': myprob['solution'],
+        'typeset': myprob.get('typeset', False),
+    }, 'defs': bank.take_defs()}
+
+def init(msg):
+    LECTURES[:] = msg['lectures']
+    STORE.update(msg['store'])
+    return {}
+
+HANDLERS = {
+    'init': init,
+    'select': lambda msg: select_lecture(msg['lec']),
+    'deal': lambda msg: deal_problem(msg['lec']),
+}
+
+async def respond(msg):
+    try:
+        reply = HANDLERS[msg['type']](msg)
+        if asyncio.iscoroutine(reply):
+            reply = await reply
+        reply['ok'] = True
+    except Exception as e:
+        reply = {'ok': False, 'error': repr(e)}
+    reply['id'] = msg['id']
+    post(reply)
+
+def on_message(event):
+    asyncio.ensure_future(respond(event.data.to_py()))
+
+xworker.onmessage = create_proxy(on_message)
+post({'type': 'ready'})
+profile("rpg:ready")
@@ -0,0 +1,203 @@
+// Service worker for the random problem generator (rpg.md), registered
+// by assets/js/rpg.js with scope /CSUN-Econ-310/rpg/, so it only sees
+// that page and what it loads. Repeat visits, and offline ones, are
+// served from three caches:
+//   runtime: PyScript and Pyodide, whose URLs carry their version, so
+//            a cached copy is good forever
+//   page:    the page, its scripts, rpg.py, rpg.toml and assets/py,
+//            served from the cache and refreshed in the background for
+//            the next visit
+//   banks:   files listed in assets/data/manifest.json, kept in IndexedDB
+//            under the sha256 the manifest gives them, so they are only
+//            downloaded again when the bank build publishes new content
+
+const VERSION = "v1";
+const RUNTIME_CACHE = `rpg-runtime-${VERSION}`;
+const PAGE_CACHE = `rpg-page-${VERSION}`;
+const DATA_URL = "/CSUN-Econ-310/assets/data/";
+const MANIFEST_URL = DATA_URL + "manifest.json";
+const VERSIONED = [
+  "https://pyscript.net/releases/",
+  "https://cdn.jsdelivr.net/pyodide/",
+];
+
+self.addEventListener("install", () => self.skipWaiting());
+
+self.addEventListener("activate", event => {
+  event.waitUntil((async () => {
+    for (const key of await caches.keys()) {
+      if (key.startsWith("rpg-") && key !== RUNTIME_CACHE && key !== PAGE_CACHE) {
+        await caches.delete(key);
+      }
+    }
+    await self.clients.claim();
+  })());
+});
+
+///////////////////////////////////////////////////////////////////
+// INDEXEDDB
+// files: sha256 -> {sha256, blob, type}
+// meta:  "manifest" -> the last manifest.json seen
+///////////////////////////////////////////////////////////////////
+
+let db = null;
+
+function openDB() {
+  if (!db) {
+    db = new Promise((resolve, reject) => {
+      const request = indexedDB.open(`rpg-${VERSION}`, 1);
+      request.onupgradeneeded = () => {
+        request.result.createObjectStore("files", { keyPath: "sha256" });
+        request.result.createObjectStore("meta");
+      };
+      request.onsuccess = () => resolve(request.result);
+      request.onerror = () => reject(request.error);
+    });
+  }
+  return db;
+}
+
+async function idb(store, mode, action) {
+  const tx = (await openDB()).transaction(store, mode);
+  const request = action(tx.objectStore(store));
+  return new Promise((resolve, reject) => {
+    tx.oncomplete = () => resolve(request && request.result);
+    tx.onerror = () => reject(tx.error);
+  });
+}
+
+///////////////////////////////////////////////////////////////////
+// MANIFEST
+// Fetched again on each visit to the page; offline, the last one seen
+// is used. When a new one arrives, files it no longer lists are dropped.
+///////////////////////////////////////////////////////////////////
+
+let manifest = null;
+
+async function fetchManifest() {
+  try {
+    const response = await fetch(MANIFEST_URL, { cache: "no-cache" });
+    if (!response.ok) throw new Error(`manifest: ${response.status}`);
+    const fresh = await response.json();
+    await idb("meta", "readwrite", store => store.put(fresh, "manifest"));
+    const keep = new Set(Object.values(fresh).map(entry => entry.sha256));
+    const stored = await idb("files", "readonly", store => store.getAllKeys());
+    await idb("files", "readwrite", store => {
+      for (const sha256 of stored) {
+        if (!keep.has(sha256)) store.delete(sha256);
+      }
+    });
+    return fresh;
+  } catch (e) {
+    return (await idb("meta", "readonly", store => store.get("manifest"))) || {};
+  }
+}
+
+function getManifest() {
+  if (!manifest) manifest = fetchManifest();
+  return manifest;
+}
+
+///////////////////////////////////////////////////////////////////
+// BANKS
+///////////////////////////////////////////////////////////////////
+
+function toHex(buffer) {
+  return Array.from(new Uint8Array(buffer), b => b.toString(16).padStart(2, "0")).join("");
+}
+
+async function getFile(name, entry) {
+  const stored = await idb("files", "readonly", store => store.get(entry.sha256));
+  if (stored) return stored;
+  // the whole file, even if the page asked for a range, so it can be stored
+  const response = await fetch(DATA_URL + name);
+  if (!response.ok) throw new Error(`${name}: ${response.status}`);
+  const buffer = await response.arrayBuffer();
+  const file = {
+    sha256: entry.sha256,
+    blob: new Blob([buffer]),
+    type: response.headers.get("Content-Type") || "application/octet-stream",
+  };
+  // a file that doesn't match the manifest is served but not kept
+  if (toHex(await crypto.subtle.digest("SHA-256", buffer)) === entry.sha256) {
+    await idb("files", "readwrite", store => store.put(file));
+  }
+  return file;
+}
+
+function respond(file, range) {
+  const size = file.blob.size;
+  const m = range && /^bytes=(\d+)-(\d*)$/.exec(range);
+  if (!m) {
+    return new Response(file.blob, { headers: { "Content-Type": file.type, "Content-Length": size } });
+  }
+  const start = Number(m[1]);
+  const end = Math.min(m[2] ? Number(m[2]) : size - 1, size - 1);
+  if (start > end) {
+    return new Response(null, { status: 416, headers: { "Content-Range": `bytes */${size}` } });
+  }
+  return new Response(file.blob.slice(start, end + 1), {
+    status: 206,
+    headers: {
+      "Content-Type": file.type,
+      "Content-Length": end - start + 1,
+      "Content-Range": `bytes ${start}-${end}/${size}`,
+    },
+  });
+}
+
+async function fromBanks(request, name) {
+  try {
+    const entry = (await getManifest())[name];
+    if (entry) return respond(await getFile(name, entry), request.headers.get("Range"));
+  } catch (e) {}
+  return fetch(request);
+}
+
+///////////////////////////////////////////////////////////////////
+// RUNTIME AND PAGE
+///////////////////////////////////////////////////////////////////
+
+async function cacheFirst(request) {
+  const cache = await caches.open(RUNTIME_CACHE);
+  const cached = await cache.match(request);
+  if (cached) return cached;
+  const response = await fetch(request);
+  if (response.ok || response.type === "opaque") {
+    await cache.put(request, response.clone());
+  }
+  return response;
+}
+
+async function staleWhileRevalidate(event) {
+  const cache = await caches.open(PAGE_CACHE);
+  const cached = await cache.match(event.request);
+  const fresh = fetch(event.request).then(async response => {
+    if (response.ok || response.type === "opaque") await cache.put(event.request, response.clone());
+    return response;
+  });
+  if (cached) {
+    event.waitUntil(fresh.catch(() => {}));
+    return cached;
+  }
+  return fresh;
+}
+
+self.addEventListener("fetch", event => {
+  const request = event.request;
+  if (request.method !== "GET") return;
+  const url = new URL(request.url);
+  if (request.mode === "navigate") {
+    // a new visit: look for a new manifest
+    manifest = null;
+  }
+  if (url.origin === location.origin && url.pathname.startsWith(DATA_URL)) {
+    if (url.pathname !== MANIFEST_URL) {
+      event.respondWith(fromBanks(request, url.pathname.slice(DATA_URL.length)));
+    }
+  } else if (VERSIONED.some(prefix => request.url.startsWith(prefix))) {
+    event.respondWith(cacheFirst(request));
+  } else if (url.origin === location.origin || request.destination === "script") {
+    event.respondWith(staleWhileRevalidate(event));
+  }
+});